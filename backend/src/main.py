@@ -1,16 +1,48 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 
+import anyio.to_thread
+from curl_cffi import requests as curl_requests
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.read.adapters.market_data.fred_adapter import FREDRateProvider
+from src.read.adapters.market_data.yahoo_finance_adapter import YahooFinanceAdapter
 from src.read.web.routers.greeks_router import router as greeks_router
 from src.read.web.routers.market_data_router import router as market_data_router
 from src.read.web.routers.vol_surface_router import router as vol_surface_router
+from src.write.adapters.pricing.black_scholes_adapter import BlackScholesAdapter
+from src.write.adapters.pricing.heston_adapter import HestonAdapter
+
+_THREADPOOL_SIZE = 200
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Les routes déportent les appels Yahoo bloquants dans le threadpool (40 par défaut)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _THREADPOOL_SIZE
+
+    # Une seule session HTTP (keep-alive, pas de handshake TLS par appel) pour tous les adapters
+    app.state.yf_session = curl_requests.Session(impersonate="chrome")
+    rate_provider = FREDRateProvider()
+    app.state.market_adapter = YahooFinanceAdapter(
+        session=app.state.yf_session, rate_provider=rate_provider
+    )
+    app.state.pricer = BlackScholesAdapter()
+    app.state.heston = HestonAdapter()
+
+    # Préchauffe le taux FRED en tâche de fond — le démarrage n'attend pas le réseau
+    asyncio.get_running_loop().run_in_executor(None, rate_provider.get_risk_free_rate)
+    yield
+    app.state.yf_session.close()
+
 
 app = FastAPI(
     title="DeskView API",
     description="Equity Derivatives Risk Terminal",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -0,0 +1,86 @@
+import pytest
+
+from src.read.adapters.cache import ttl_cache
+from src.read.adapters.cache.ttl_cache import TTLCache, ttl_cached
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_before_expiry(clock):
+    cache = TTLCache(ttl=30)
+    cache.set("AAPL", 1.0)
+    clock[0] += 29
+    assert cache.get("AAPL") == 1.0
+
+
+def test_get_drops_value_after_expiry(clock):
+    cache = TTLCache(ttl=30)
+    cache.set("AAPL", 1.0)
+    clock[0] += 31
+    assert cache.get("AAPL") is None
+    assert len(cache) == 0
+
+
+def test_maxsize_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cached_memoizes_per_arguments(clock):
+    calls = []
+
+    class Adapter:
+        @ttl_cached(TTLCache(), ttl=30)
+        def fetch(self, ticker: str) -> str:
+            calls.append(ticker)
+            return ticker.lower()
+
+    adapter = Adapter()
+    assert adapter.fetch("AAPL") == "aapl"
+    assert adapter.fetch("AAPL") == "aapl"
+    assert adapter.fetch("MSFT") == "msft"
+    assert calls == ["AAPL", "MSFT"]
+
+    clock[0] += 31
+    adapter.fetch("AAPL")
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+
+def test_ttl_cached_is_per_instance(clock):
+    class Adapter:
+        def __init__(self, rate: float) -> None:
+            self.rate = rate
+
+        @ttl_cached(TTLCache(), ttl=30)
+        def fetch(self, ticker: str) -> float:
+            return self.rate
+
+    assert Adapter(0.04).fetch("AAPL") == 0.04
+    assert Adapter(0.05).fetch("AAPL") == 0.05
+
+
+def test_ttl_cached_does_not_cache_exceptions(clock):
+    calls = []
+
+    class Adapter:
+        @ttl_cached(TTLCache(), ttl=30)
+        def fetch(self, ticker: str) -> str:
+            calls.append(ticker)
+            raise ValueError(ticker)
+
+    adapter = Adapter()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            adapter.fetch("AAPL")
+    assert len(calls) == 2
@@ -0,0 +1,70 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Cache LRU thread-safe dont les entrées expirent `ttl` secondes après insertion."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def ttl_cached(cache: TTLCache, ttl: float | None = None) -> Callable:
+    """
+    Mémoïse une méthode pendant `ttl` secondes.
+
+    La clé est (nom qualifié, instance, args, kwargs) : deux instances configurées
+    différemment (session, rate provider…) ne se servent jamais l'une l'autre.
+    Les exceptions ne sont pas cachées.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = (fn.__qualname__, self, args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = fn(self, *args, **kwargs)
+                cache.set(key, value, ttl)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
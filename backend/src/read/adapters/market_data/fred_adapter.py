@@ -0,0 +1,62 @@
+import os
+
+import httpx
+
+from src.read.adapters.cache.ttl_cache import TTLCache
+
+_FRED_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# Un fetch par série et par jour, partagé par toutes les instances
+_cache = TTLCache(maxsize=16, ttl=86400)
+# En cas d'échec, on ne retente pas FRED à chaque requête
+_RETRY_AFTER = 300
+
+
+class FREDRateProvider:
+    """Taux sans risque depuis FRED (T-bill 3 mois par défaut), rafraîchi une fois par jour."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        series_id: str = "DTB3",
+        fallback_rate: float = 0.05,
+        timeout: float = 5.0,
+    ) -> None:
+        self.api_key = api_key if api_key is not None else os.getenv("FRED_API_KEY")
+        self.series_id = series_id
+        self.fallback_rate = fallback_rate
+        self.timeout = timeout
+
+    def get_risk_free_rate(self) -> float:
+        rate = _cache.get(self.series_id)
+        if rate is None:
+            rate = self._fetch()
+            if rate is None:
+                _cache.set(self.series_id, self.fallback_rate, ttl=_RETRY_AFTER)
+                return self.fallback_rate
+            _cache.set(self.series_id, rate)
+        return rate
+
+    def _fetch(self) -> float | None:
+        if not self.api_key:
+            return None
+        try:
+            response = httpx.get(
+                _FRED_URL,
+                params={
+                    "series_id": self.series_id,
+                    "api_key": self.api_key,
+                    "file_type": "json",
+                    "sort_order": "desc",
+                    "limit": 10,
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            # Les jours fériés sont publiés avec la valeur "."
+            for obs in response.json()["observations"]:
+                if obs["value"] != ".":
+                    return float(obs["value"]) / 100
+        except (httpx.HTTPError, KeyError, ValueError):
+            return None
+        return None
@@ -0,0 +1,51 @@
+import httpx
+import pytest
+
+from src.read.adapters.market_data import fred_adapter
+from src.read.adapters.market_data.fred_adapter import FREDRateProvider
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    fred_adapter._cache.clear()
+    yield
+    fred_adapter._cache.clear()
+
+
+def _response(values: list[str]) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"observations": [{"value": v} for v in values]},
+        request=httpx.Request("GET", fred_adapter._FRED_URL),
+    )
+
+
+def test_parses_latest_valid_observation(monkeypatch):
+    monkeypatch.setattr(fred_adapter.httpx, "get", lambda *a, **k: _response([".", "4.21"]))
+    assert FREDRateProvider(api_key="key").get_risk_free_rate() == pytest.approx(0.0421)
+
+
+def test_rate_is_fetched_once_per_day(monkeypatch):
+    calls = []
+
+    def fake_get(*args, **kwargs):
+        calls.append(kwargs["params"]["series_id"])
+        return _response(["4.21"])
+
+    monkeypatch.setattr(fred_adapter.httpx, "get", fake_get)
+    provider = FREDRateProvider(api_key="key")
+    provider.get_risk_free_rate()
+    FREDRateProvider(api_key="key").get_risk_free_rate()
+    assert calls == ["DTB3"]
+
+
+def test_falls_back_without_api_key():
+    assert FREDRateProvider(api_key="", fallback_rate=0.04).get_risk_free_rate() == 0.04
+
+
+def test_falls_back_on_http_error(monkeypatch):
+    def fake_get(*args, **kwargs):
+        raise httpx.ConnectError("down")
+
+    monkeypatch.setattr(fred_adapter.httpx, "get", fake_get)
+    assert FREDRateProvider(api_key="key").get_risk_free_rate() == 0.05
@@ -1,13 +1,60 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from src.read.adapters.market_data import yahoo_finance_adapter
+from src.read.adapters.market_data.fred_adapter import FREDRateProvider
 from src.read.adapters.market_data.yahoo_finance_adapter import YahooFinanceAdapter
 
 
+class StubRateProvider(FREDRateProvider):
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+
+    def get_risk_free_rate(self) -> float:
+        return self.rate
+
+
+class StubStock:
+    fast_info = SimpleNamespace(last_price=101.0, previous_close=100.0)
+    info = {"dividendYield": 1.5}  # en %
+
+    def history(self, period: str) -> pd.DataFrame:
+        return pd.DataFrame({"Close": [100.0, 101.0, 100.0, 102.0]})
+
+
 @pytest.fixture
 def adapter():
     return YahooFinanceAdapter()
 
 
+@pytest.fixture
+def stub_adapter():
+    yahoo_finance_adapter._cache.clear()
+    yield lambda rate: _stubbed(YahooFinanceAdapter(rate_provider=StubRateProvider(rate)))
+    yahoo_finance_adapter._cache.clear()
+
+
+def _stubbed(adapter: YahooFinanceAdapter) -> YahooFinanceAdapter:
+    adapter.ticker = lambda symbol: StubStock()
+    return adapter
+
+
+def test_get_market_data_uses_injected_rate_provider(stub_adapter):
+    data = stub_adapter(0.042).get_market_data("AAPL")
+    assert data.spot == 101.0
+    assert data.risk_free_rate == 0.042
+    assert data.dividend_yield == pytest.approx(0.015)
+    assert 0 < data.implied_vol < 2
+
+
+def test_get_market_data_cache_is_per_instance(stub_adapter):
+    assert stub_adapter(0.03).get_market_data("AAPL").risk_free_rate == 0.03
+    assert stub_adapter(0.05).get_market_data("AAPL").risk_free_rate == 0.05
+
+
 def test_get_market_data_aapl(adapter):
     data = adapter.get_market_data("AAPL")
     assert data.spot > 0
@@ -25,3 +72,44 @@ def test_get_options_chain(adapter):
     assert "calls" in chain
     assert "puts" in chain
     assert len(chain["calls"]) > 0
+
+
+def test_get_market_data_batch(adapter):
+    batch = adapter.get_market_data_batch(["AAPL", "MSFT"])
+    assert set(batch) == {"AAPL", "MSFT"}
+    assert all(data.spot > 0 for data in batch.values())
+    assert all(0 < data.implied_vol < 2 for data in batch.values())
+
+
+def test_get_market_data_batch_uses_one_download(stub_adapter, monkeypatch):
+    dates = pd.bdate_range(end="2026-10-15", periods=250)
+    closes = pd.DataFrame(
+        {
+            "AAPL": np.linspace(150.0, 200.0, len(dates)),
+            "MSFT": 400.0,
+            "DEAD": np.nan,
+        },
+        index=dates,
+    )
+    dividends = pd.DataFrame(0.0, index=dates, columns=closes.columns)
+    dividends.loc[dates[[50, 110, 170, 230]], "AAPL"] = 0.25
+    hist = pd.concat({"Close": closes, "Dividends": dividends}, axis=1)
+    calls = []
+
+    def download(tickers, **kwargs):
+        calls.append(tickers)
+        assert kwargs["multi_level_index"]
+        return hist
+
+    monkeypatch.setattr(yahoo_finance_adapter.yf, "download", download)
+    adapter = stub_adapter(0.04)
+    adapter.ticker = None  # aucun appel par symbole
+
+    batch = adapter.get_market_data_batch(["AAPL", "MSFT", "DEAD"])
+    assert calls == [["AAPL", "MSFT", "DEAD"]]
+    assert set(batch) == {"AAPL", "MSFT"}
+    assert batch["AAPL"].spot == 200.0
+    assert batch["AAPL"].dividend_yield == pytest.approx(1.0 / 200.0)
+    assert batch["MSFT"].dividend_yield == 0.0
+    assert batch["MSFT"].implied_vol == 0.0
+    assert batch["AAPL"].risk_free_rate == 0.04
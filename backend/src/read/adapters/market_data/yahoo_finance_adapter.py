@@ -1,27 +1,57 @@
 import numpy as np
+import pandas as pd
 import yfinance as yf
 
+from src.read.adapters.cache.ttl_cache import TTLCache, ttl_cached
+from src.read.adapters.market_data.fred_adapter import FREDRateProvider
 from src.shared.domain.value_objects.market_data import MarketData
 
+# Cache process-wide : les polls répétés du dashboard sont servis depuis la mémoire
+_cache = TTLCache(maxsize=512, ttl=30)
+
+# Yahoo accepte ~20 symboles par requête batchée
+_BATCH_SIZE = 20
+
+
+def _dividend_yield(info: dict) -> float:
+    raw = info.get("dividendYield") or 0.0
+    return float(raw if raw < 1 else raw / 100)
+
 
 class YahooFinanceAdapter:
+    def __init__(self, session=None, rate_provider: FREDRateProvider | None = None) -> None:
+        # Session HTTP partagée (keep-alive) ; None laisse yfinance gérer la sienne
+        self.session = session
+        self.rate_provider = rate_provider or FREDRateProvider()
+
+    def ticker(self, symbol: str) -> yf.Ticker:
+        return yf.Ticker(symbol, session=self.session)
+
+    @ttl_cached(_cache, ttl=3600)  # sert surtout au dividend yield, qui bouge peu en intraday
+    def _info(self, ticker: str) -> dict:
+        """`.info` est un scrape multi-endpoints très lent — à éviter sur le chemin du spot."""
+        return self.ticker(ticker).info
+
+    @ttl_cached(_cache, ttl=30)
     def get_market_data(self, ticker: str, implied_vol: float = None) -> MarketData:
         """Récupère les données de marché pour un ticker."""
-        stock = yf.Ticker(ticker)
+        stock = self.ticker(ticker)
 
-        # Spot price
-        info = stock.info
-        spot = info.get("currentPrice") or info.get("regularMarketPrice")
+        # Spot price — fast_info tape un seul endpoint de quote léger ; .info en fallback
+        fi = stock.fast_info
+        spot = fi.last_price or fi.previous_close
+        if not spot:
+            info = self._info(ticker)
+            spot = info.get("currentPrice") or info.get("regularMarketPrice")
         if not spot:
             hist = stock.history(period="1d")
             spot = float(hist["Close"].iloc[-1])
 
-        # Risk-free rate (on utilise le taux US 3 mois comme proxy)
-        risk_free = 0.05  # On hardcode pour l'instant, on branchera FRED après
+        # Risk-free rate (taux US 3 mois FRED, caché à la journée)
+        risk_free = self.rate_provider.get_risk_free_rate()
 
         # Dividend yield
-        raw = info.get("dividendYield") or 0.0
-        dividend_yield = raw if raw < 1 else raw / 100
+        dividend_yield = _dividend_yield(self._info(ticker))
 
         # Vol implicite — si pas fournie, on calcule une vol historique 30j
         if implied_vol is None:
@@ -36,39 +66,88 @@ class YahooFinanceAdapter:
             dividend_yield=float(dividend_yield),
         )
 
+    def get_market_data_batch(self, tickers: list[str]) -> dict[str, MarketData]:
+        """
+        Données de marché pour plusieurs tickers en un minimum de roundtrips.
+
+        Un seul téléchargement par paquet de `_BATCH_SIZE` symboles fournit spot,
+        vol historique 30j et dividendes ; les tickers sans données sont absents du résultat.
+        """
+        result: dict[str, MarketData] = {}
+        for i in range(0, len(tickers), _BATCH_SIZE):
+            result.update(self._market_data_chunk(tickers[i : i + _BATCH_SIZE]))
+        return result
+
+    def _market_data_chunk(self, tickers: list[str]) -> dict[str, MarketData]:
+        # 1 an d'historique : le dividend yield est calculé sur les 12 derniers mois
+        hist = yf.download(
+            tickers,
+            period="1y",
+            actions=True,
+            group_by="column",
+            multi_level_index=True,  # colonnes (champ, ticker) même pour un seul ticker
+            threads=True,
+            progress=False,
+            session=self.session,
+        )
+        if hist is None or hist.empty:
+            return {}
+
+        closes = hist["Close"]
+        # Spot = dernière clôture (la séance en cours y figure en intraday)
+        spots = closes.ffill().iloc[-1]
+        # Vol historique 30j, vectorisée sur toutes les colonnes en un seul appel
+        recent = closes[closes.index >= closes.index[-1] - pd.Timedelta(days=30)]
+        vols = np.log(recent / recent.shift(1)).std() * np.sqrt(252)
+        dividends = hist["Dividends"].sum() if "Dividends" in hist else 0.0 * spots
+
+        risk_free = self.rate_provider.get_risk_free_rate()
+        return {
+            t: MarketData(
+                spot=float(spots[t]),
+                implied_vol=float(vols[t]),
+                risk_free_rate=risk_free,
+                dividend_yield=float(dividends[t] / spots[t]),
+            )
+            for t in tickers
+            if t in closes.columns and closes[t].notna().any()
+        }
+
     def get_options_chain(self, ticker: str, maturity_index: int = 0):
         """Récupère la chaîne d'options pour un ticker et une maturité."""
-        stock = yf.Ticker(ticker)
-        expirations = stock.options
+        expirations = self.get_available_maturities(ticker)
 
         if not expirations:
             raise ValueError(f"No options data available for {ticker}")
 
-        expiry = expirations[maturity_index]
-        chain = stock.option_chain(expiry)
+        return self.get_option_chain_for_expiry(ticker, expirations[maturity_index])
 
+    @ttl_cached(_cache, ttl=30)
+    def get_option_chain_for_expiry(self, ticker: str, expiry: str) -> dict:
+        """Chaîne d'options pour une expiry donnée — partagée entre tous les endpoints."""
+        chain = self.ticker(ticker).option_chain(expiry)
         return {
             "expiry": expiry,
             "calls": chain.calls,
             "puts": chain.puts,
         }
 
+    @ttl_cached(_cache, ttl=30)
     def get_available_maturities(self, ticker: str) -> list[str]:
         """Retourne les maturités disponibles pour un ticker."""
-        stock = yf.Ticker(ticker)
+        stock = self.ticker(ticker)
         return list(stock.options)
 
+    @ttl_cached(_cache, ttl=300)  # les clôtures daily ne bougent pas en intraday
     def get_price_history(self, ticker: str, period: str = "3mo") -> list[dict]:
-        stock = yf.Ticker(ticker)
+        stock = self.ticker(ticker)
         hist = stock.history(period=period)
         if hist.empty:
             raise ValueError(f"No price history for {ticker}")
 
-        data: list[dict] = []
-        for idx, row in hist.iterrows():
-            close = float(row["Close"])
-            if close == close:  # NaN check
-                data.append({"date": idx.strftime("%Y-%m-%d"), "close": round(close, 2)})
+        closes = hist["Close"].dropna().round(2)
+        dates = closes.index.strftime("%Y-%m-%d").tolist()
+        data = [{"date": d, "close": c} for d, c in zip(dates, closes.tolist(), strict=True)]
 
         if not data:
             raise ValueError(f"No valid price data for {ticker}")
@@ -0,0 +1,26 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from src.read.adapters.market_data.yahoo_finance_adapter import YahooFinanceAdapter
+from src.write.adapters.pricing.black_scholes_adapter import BlackScholesAdapter
+from src.write.adapters.pricing.heston_adapter import HestonAdapter
+
+# Adapters à durée de vie process, créés au démarrage dans le lifespan de `src.main`
+
+
+def get_market_adapter(request: Request) -> YahooFinanceAdapter:
+    return request.app.state.market_adapter
+
+
+def get_pricer(request: Request) -> BlackScholesAdapter:
+    return request.app.state.pricer
+
+
+def get_heston(request: Request) -> HestonAdapter:
+    return request.app.state.heston
+
+
+MarketAdapterDep = Annotated[YahooFinanceAdapter, Depends(get_market_adapter)]
+PricerDep = Annotated[BlackScholesAdapter, Depends(get_pricer)]
+HestonDep = Annotated[HestonAdapter, Depends(get_heston)]
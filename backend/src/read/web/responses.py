@@ -0,0 +1,24 @@
+from typing import Any
+
+import msgspec
+import numpy as np
+from fastapi.responses import Response
+
+
+def _enc_hook(obj: Any) -> Any:
+    # Scalaires NumPy (np.float64, np.int64…) qui s'échappent des calculs
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+class MsgspecJSONResponse(Response):
+    """Réponse JSON encodée par msgspec — contourne la validation/sérialisation pydantic."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
@@ -1,19 +1,19 @@
 from datetime import date
 
+import msgspec
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from src.read.adapters.market_data.yahoo_finance_adapter import YahooFinanceAdapter
+from src.read.web.dependencies import MarketAdapterDep, PricerDep
+from src.read.web.responses import MsgspecJSONResponse
 from src.shared.domain.entities.option_contract import (
     OptionContract,
     OptionType,
     Underlying,
 )
-from src.write.adapters.pricing.black_scholes_adapter import BlackScholesAdapter
 
 router = APIRouter(prefix="/greeks", tags=["Greeks"])
-market_adapter = YahooFinanceAdapter()
-pricer = BlackScholesAdapter()
 
 
 class GreeksRequest(BaseModel):
@@ -24,7 +24,7 @@ class GreeksRequest(BaseModel):
     quantity: float = 1.0
 
 
-class GreeksResponse(BaseModel):
+class GreeksResponse(msgspec.Struct):
     ticker: str
     spot: float
     option_type: str
@@ -37,10 +37,13 @@ class GreeksResponse(BaseModel):
     rho: float
 
 
-@router.post("/greeks", response_model=GreeksResponse)
-def get_greeks(request: GreeksRequest):
+@router.post("/greeks", response_class=MsgspecJSONResponse)
+async def get_greeks(request: GreeksRequest, market_adapter: MarketAdapterDep, pricer: PricerDep):
     try:
-        market_data = market_adapter.get_market_data(request.ticker.upper())
+        as_of = date.today()  # figée une fois par requête
+        market_data = await run_in_threadpool(
+            market_adapter.get_market_data, request.ticker.upper()
+        )
 
         contract = OptionContract(
             underlying=Underlying(ticker=request.ticker.upper()),
@@ -50,20 +53,21 @@ def get_greeks(request: GreeksRequest):
             quantity=request.quantity,
         )
 
-        greeks = pricer.greeks(contract, market_data)
-        price = pricer.price(contract, market_data)
+        price, greeks = pricer.price_and_greeks(contract, market_data, as_of)
 
-        return GreeksResponse(
-            ticker=request.ticker.upper(),
-            spot=market_data.spot,
-            option_type=request.option_type,
-            strike=request.strike,
-            price=round(price, 4),
-            delta=round(greeks.delta, 4),
-            gamma=round(greeks.gamma, 6),
-            vega=round(greeks.vega, 4),
-            theta=round(greeks.theta, 4),
-            rho=round(greeks.rho, 4),
+        return MsgspecJSONResponse(
+            GreeksResponse(
+                ticker=request.ticker.upper(),
+                spot=market_data.spot,
+                option_type=request.option_type,
+                strike=request.strike,
+                price=round(price, 4),
+                delta=round(greeks.delta, 4),
+                gamma=round(greeks.gamma, 6),
+                vega=round(greeks.vega, 4),
+                theta=round(greeks.theta, 4),
+                rho=round(greeks.rho, 4),
+            )
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -1,13 +1,14 @@
+import msgspec
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.concurrency import run_in_threadpool
 
-from src.read.adapters.market_data.yahoo_finance_adapter import YahooFinanceAdapter
+from src.read.web.dependencies import MarketAdapterDep
+from src.read.web.responses import MsgspecJSONResponse
 
 router = APIRouter(prefix="/market-data", tags=["Market Data"])
-adapter = YahooFinanceAdapter()
 
 
-class MarketDataResponse(BaseModel):
+class MarketDataResponse(msgspec.Struct):
     ticker: str
     spot: float
     implied_vol: float
@@ -15,35 +16,67 @@ class MarketDataResponse(BaseModel):
     dividend_yield: float
 
 
-@router.get("/market-data/{ticker}", response_model=MarketDataResponse)
-def get_market_data(ticker: str):
+@router.get("/market-data/{ticker}", response_class=MsgspecJSONResponse)
+async def get_market_data(ticker: str, adapter: MarketAdapterDep):
     try:
-        data = adapter.get_market_data(ticker.upper())
-        return MarketDataResponse(
-            ticker=ticker.upper(),
-            spot=data.spot,
-            implied_vol=data.implied_vol,
-            risk_free_rate=data.risk_free_rate,
-            dividend_yield=data.dividend_yield,
+        data = await run_in_threadpool(adapter.get_market_data, ticker.upper())
+        return MsgspecJSONResponse(
+            MarketDataResponse(
+                ticker=ticker.upper(),
+                spot=data.spot,
+                implied_vol=data.implied_vol,
+                risk_free_rate=data.risk_free_rate,
+                dividend_yield=data.dividend_yield,
+            )
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.get("/market-data", response_class=MsgspecJSONResponse)
+async def get_market_data_batch(
+    adapter: MarketAdapterDep,
+    tickers: str = Query(..., description="Comma-separated, e.g. AAPL,MSFT"),
+):
+    try:
+        symbols = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+        if not symbols:
+            raise ValueError("No tickers provided")
+        batch = await run_in_threadpool(adapter.get_market_data_batch, symbols)
+        return MsgspecJSONResponse(
+            [
+                MarketDataResponse(
+                    ticker=ticker,
+                    spot=data.spot,
+                    implied_vol=data.implied_vol,
+                    risk_free_rate=data.risk_free_rate,
+                    dividend_yield=data.dividend_yield,
+                )
+                for ticker, data in batch.items()
+            ]
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/maturities/{ticker}")
-def get_maturities(ticker: str):
+async def get_maturities(ticker: str, adapter: MarketAdapterDep):
     try:
-        maturities = adapter.get_available_maturities(ticker.upper())
+        maturities = await run_in_threadpool(adapter.get_available_maturities, ticker.upper())
         return {"ticker": ticker.upper(), "maturities": maturities}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@router.get("/price-history/{ticker}")
-def get_price_history(ticker: str, period: str = Query(default="3mo")):
+@router.get("/price-history/{ticker}", response_class=MsgspecJSONResponse)
+async def get_price_history(
+    ticker: str,
+    adapter: MarketAdapterDep,
+    period: str = Query(default="3mo"),
+):
     try:
-        data = adapter.get_price_history(ticker.upper(), period=period)
-        return {"ticker": ticker.upper(), "data": data, "period": period}
+        data = await run_in_threadpool(adapter.get_price_history, ticker.upper(), period=period)
+        return MsgspecJSONResponse({"ticker": ticker.upper(), "data": data, "period": period})
     except HTTPException:
         raise
     except Exception as e:
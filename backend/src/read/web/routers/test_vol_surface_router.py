@@ -0,0 +1,104 @@
+import math
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.special import ndtr
+
+from src.read.web.routers.vol_surface_router import _fetch_iv_points
+
+S, R, Q, SIGMA = 100.0, 0.04, 0.01, 0.25
+STRIKES = [60.0, 80.0, 90.0, 100.0, 110.0, 120.0, 140.0]
+
+
+def bs_price(K: float, T: float, is_call: bool) -> float:
+    sig_sqrt_T = SIGMA * math.sqrt(T)
+    d1 = (math.log(S / K) + (R - Q + 0.5 * SIGMA**2) * T) / sig_sqrt_T
+    call = S * math.exp(-Q * T) * ndtr(d1) - K * math.exp(-R * T) * ndtr(d1 - sig_sqrt_T)
+    return call if is_call else call - S * math.exp(-Q * T) + K * math.exp(-R * T)
+
+
+class StubMarket:
+    """Chaînes synthétiques à vol plate : mid = prix BS à 25 %."""
+
+    def __init__(self, days: list[int]) -> None:
+        today = date.today()
+        self.expiries = {(today + timedelta(days=d)).isoformat(): d / 365.0 for d in days}
+
+    def get_available_maturities(self, ticker: str) -> list[str]:
+        return list(self.expiries)
+
+    def get_option_chain_for_expiry(self, ticker: str, expiry: str) -> dict:
+        T = self.expiries[expiry]
+
+        def side(is_call: bool) -> pd.DataFrame:
+            price = np.array([bs_price(k, T, is_call) for k in STRIKES])
+            return pd.DataFrame(
+                {"strike": STRIKES, "bid": price - 0.01, "ask": price + 0.01, "volume": 10.0}
+            )
+
+        calls, puts = side(True), side(False)
+        calls.loc[calls["strike"] == 90.0, "bid"] = np.nan  # pas de bid : rejeté
+        calls.loc[calls["strike"] == 110.0, "ask"] = calls["bid"] - 0.01  # ask < bid : rejeté
+        puts.loc[puts["strike"] == 110.0, "volume"] = np.nan  # volume absent : poids 1
+        return {"expiry": expiry, "calls": calls, "puts": puts}
+
+
+@pytest.fixture
+def market():
+    # 3 j et 1000 j tombent hors de la fenêtre [7, 730] j par défaut
+    return StubMarket([3, 30, 180, 1000])
+
+
+def test_fetch_iv_points_filters_quotes(market):
+    points = _fetch_iv_points(market, "X", S, R, Q)
+
+    assert {p["maturity_str"] for p in points} == set(list(market.expiries)[1:3])
+    assert {p["_K"] for p in points} <= {80.0, 90.0, 100.0, 110.0, 120.0}
+    by_key = {(p["maturity_str"], p["option_type"], p["_K"]): p for p in points}
+    for exp in list(market.expiries)[1:3]:
+        assert (exp, "call", 90.0) not in by_key
+        assert (exp, "call", 110.0) not in by_key
+        assert by_key[(exp, "put", 110.0)]["volume"] == 0
+        assert by_key[(exp, "put", 110.0)]["_weight"] == 1.0
+        assert by_key[(exp, "call", 80.0)]["_weight"] == 10.0
+    np.testing.assert_allclose([p["_iv_raw"] for p in points], SIGMA, atol=1e-6)
+
+
+def test_fetch_iv_points_otm_only(market):
+    points = _fetch_iv_points(market, "X", S, R, Q, otm_only=True)
+
+    assert points
+    for p in points:
+        F = S * math.exp((R - Q) * p["_T"])
+        if p["option_type"] == "call":
+            assert p["_K"] >= 0.99 * F
+        else:
+            assert p["_K"] <= 1.01 * F
+
+
+def test_fetch_iv_points_output_keys(market):
+    point = _fetch_iv_points(market, "X", S, R, Q)[0]
+
+    assert set(point) == {
+        "strike",
+        "maturity",
+        "maturity_str",
+        "iv",
+        "moneyness",
+        "option_type",
+        "volume",
+        "_iv_raw",
+        "_K",
+        "_T",
+        "_weight",
+    }
+    assert point["iv"] == pytest.approx(SIGMA * 100, abs=1e-3)
+    assert point["moneyness"] == pytest.approx(point["_K"] / S, abs=1e-4)
+    assert point["maturity"] == pytest.approx(point["_T"], abs=1e-6)
+
+
+def test_fetch_iv_points_without_maturities_in_window():
+    with pytest.raises(ValueError):
+        _fetch_iv_points(StubMarket([3, 1000]), "X", S, R, Q)
@@ -8,23 +8,27 @@ Two endpoints:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 import numpy as np
-import yfinance as yf
+import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 
 from src.read.adapters.market_data.yahoo_finance_adapter import YahooFinanceAdapter
-from src.write.adapters.pricing.heston_adapter import HestonAdapter, bs_implied_vol
+from src.read.web.dependencies import HestonDep, MarketAdapterDep
+from src.read.web.responses import MsgspecJSONResponse
+from src.write.adapters.pricing.heston_adapter import bs_implied_vol_vec
 
 router = APIRouter(prefix="/vol-surface", tags=["Vol Surface"])
-_market = YahooFinanceAdapter()
-_heston = HestonAdapter()
+_MAX_FETCH_WORKERS = 8
 
 # ── helpers ────────────────────────────────────────────────────────────────────
 
 
 def _fetch_iv_points(
+    market: YahooFinanceAdapter,
     ticker: str,
     S: float,
     r: float,
@@ -42,80 +46,100 @@ def _fetch_iv_points(
     Returns list of dicts: {strike, maturity, maturity_str, iv, moneyness, option_type}
     where iv is in % (e.g. 25.4 means 25.4 %).
     """
-    stock = yf.Ticker(ticker)
-    expirations = stock.options
+    # Cached adapter calls: /market and /heston on the same ticker share one fetch
+    expirations = market.get_available_maturities(ticker)
     if not expirations:
         raise ValueError(f"No options data available for {ticker}")
 
     today = date.today()
 
-    valid_exp = [
-        e for e in expirations if min_days <= (date.fromisoformat(e) - today).days <= max_days
-    ]
+    # One date parse per expiry; T and forward are then looked up, never recomputed
+    days_by_exp = {e: (date.fromisoformat(e) - today).days for e in expirations}
+    valid_exp = [e for e in expirations if min_days <= days_by_exp[e] <= max_days]
     selected = valid_exp[:max_maturities]
     if not selected:
         raise ValueError(f"No maturities in the {min_days}–{max_days}d window for {ticker}")
+    T_by_exp = {e: days_by_exp[e] / 365.0 for e in selected}
+    F_by_exp = {e: S * np.exp((r - q) * T) for e, T in T_by_exp.items()}
 
-    points: list[dict] = []
-    F_by_T: dict[str, float] = {}
-
-    for exp_str in selected:
-        T = (date.fromisoformat(exp_str) - today).days / 365.0
-        if T <= 0:
-            continue
-        F_by_T[exp_str] = S * np.exp((r - q) * T)
-
+    def _fetch_chain(exp_str: str):
         try:
-            chain = stock.option_chain(exp_str)
+            return market.get_option_chain_for_expiry(ticker, exp_str)
         except Exception:
-            continue
+            return None
+
+    # One blocking HTTP request per expiry — fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(selected))) as pool:
+        chains = list(pool.map(_fetch_chain, selected))
 
-        for opt_type, df in [("call", chain.calls), ("put", chain.puts)]:
-            F = F_by_T[exp_str]
-            for _, row in df.iterrows():
-                K = float(row["strike"])
-                bid = float(row.get("bid", 0) or 0)
-                ask = float(row.get("ask", 0) or 0)
-
-                # Moneyness filter
-                m = K / S
-                if not (moneyness_lo <= m <= moneyness_hi):
-                    continue
-
-                # OTM-only filter (improves calibration quality)
-                if otm_only:
-                    if opt_type == "call" and K < F * 0.99:
-                        continue
-                    if opt_type == "put" and K > F * 1.01:
-                        continue
-
-                # Liquidity / quote validity
-                if bid <= 0 or ask <= bid:
-                    continue
-                mid = (bid + ask) / 2.0
-                if (ask - bid) > mid:  # spread > 100 % of mid
-                    continue
-
-                iv_raw = bs_implied_vol(mid, S, K, T, r, q, opt_type)
-                if iv_raw is None or not (0.02 <= iv_raw <= 3.0):
-                    continue
-
-                volume = float(row.get("volume", 0) or 0)
-                points.append(
-                    {
-                        "strike": round(K, 2),
-                        "maturity": round(T, 6),
-                        "maturity_str": exp_str,
-                        "iv": round(iv_raw * 100, 4),  # in %
-                        "moneyness": round(m, 4),
-                        "option_type": opt_type,
-                        "volume": int(volume),
-                        "_iv_raw": iv_raw,  # keep raw for calibration
-                        "_K": K,
-                        "_T": T,
-                        "_weight": max(volume, 1.0),
-                    }
+    # Stack calls and puts of every expiry into one frame: a single mask, a single IV pass
+    frames = []
+    for exp_str, chain in zip(selected, chains, strict=True):
+        T = T_by_exp[exp_str]
+        if T <= 0 or chain is None:
+            continue
+        for opt_type, df in [("call", chain["calls"]), ("put", chain["puts"])]:
+            frames.append(
+                df[["strike", "bid", "ask", "volume"]].assign(
+                    T=T, F=F_by_exp[exp_str], maturity_str=exp_str, option_type=opt_type
                 )
+            )
+    if not frames:
+        return []
+
+    quotes = pd.concat(frames, ignore_index=True)
+    K = quotes["strike"].to_numpy(dtype=float)
+    T = quotes["T"].to_numpy(dtype=float)
+    bid = quotes["bid"].fillna(0).to_numpy(dtype=float)
+    ask = quotes["ask"].fillna(0).to_numpy(dtype=float)
+    is_call = (quotes["option_type"] == "call").to_numpy()
+    m = K / S
+    mid = (bid + ask) / 2.0
+
+    mask = (
+        (m >= moneyness_lo)
+        & (m <= moneyness_hi)
+        # Liquidity / quote validity — spread ≤ 100 % of mid
+        & (bid > 0)
+        & (ask > bid)
+        & ((ask - bid) <= mid)
+    )
+    # OTM-only filter (improves calibration quality)
+    if otm_only:
+        F = quotes["F"].to_numpy(dtype=float)
+        mask &= np.where(is_call, K >= F * 0.99, K <= F * 1.01)
+
+    iv_raw = np.full(K.shape, np.nan)
+    if mask.any():
+        iv_raw[mask] = bs_implied_vol_vec(mid[mask], S, K[mask], T[mask], r, q, is_call[mask])
+    keep = mask & (iv_raw >= 0.02) & (iv_raw <= 3.0)  # NaN (no solution) compares False
+
+    volume = quotes["volume"].fillna(0).to_numpy(dtype=float)
+    points = [
+        {
+            "strike": round(k, 2),
+            "maturity": round(t, 6),
+            "maturity_str": exp_str,
+            "iv": round(iv * 100, 4),  # in %
+            "moneyness": round(mm, 4),
+            "option_type": opt_type,
+            "volume": int(vol),
+            "_iv_raw": iv,  # keep raw for calibration
+            "_K": k,
+            "_T": t,
+            "_weight": max(vol, 1.0),
+        }
+        for k, t, exp_str, iv, mm, opt_type, vol in zip(
+            K[keep].tolist(),
+            T[keep].tolist(),
+            quotes["maturity_str"].to_numpy()[keep].tolist(),
+            iv_raw[keep].tolist(),
+            m[keep].tolist(),
+            quotes["option_type"].to_numpy()[keep].tolist(),
+            volume[keep].tolist(),
+            strict=True,
+        )
+    ]
 
     return points
 
@@ -123,9 +147,10 @@ def _fetch_iv_points(
 # ── endpoints ──────────────────────────────────────────────────────────────────
 
 
-@router.get("/{ticker}/market")
-def get_market_surface(
+@router.get("/{ticker}/market", response_class=MsgspecJSONResponse)
+async def get_market_surface(
     ticker: str,
+    market: MarketAdapterDep,
     max_maturities: int = Query(default=8, ge=1, le=15),
 ):
     """
@@ -134,24 +159,28 @@ def get_market_surface(
     """
     try:
         ticker = ticker.upper()
-        md = _market.get_market_data(ticker)
+        md = await run_in_threadpool(market.get_market_data, ticker)
         S, r, q = float(md.spot), float(md.risk_free_rate), float(md.dividend_yield)
 
-        pts = _fetch_iv_points(ticker, S, r, q, max_maturities=max_maturities)
+        pts = await run_in_threadpool(
+            _fetch_iv_points, market, ticker, S, r, q, max_maturities=max_maturities
+        )
         if not pts:
             raise ValueError(f"No valid implied-vol points found for {ticker}")
 
         # Strip internal keys
         public_pts = [{k: v for k, v in p.items() if not k.startswith("_")} for p in pts]
 
-        return {
-            "ticker": ticker,
-            "spot": round(S, 2),
-            "r": round(r, 4),
-            "q": round(float(q), 4),
-            "n_points": len(public_pts),
-            "points": public_pts,
-        }
+        return MsgspecJSONResponse(
+            {
+                "ticker": ticker,
+                "spot": round(S, 2),
+                "r": round(r, 4),
+                "q": round(float(q), 4),
+                "n_points": len(public_pts),
+                "points": public_pts,
+            }
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -159,9 +188,11 @@ def get_market_surface(
         raise HTTPException(status_code=500, detail=f"Market surface error: {e}") from e
 
 
-@router.get("/{ticker}/heston")
-def get_heston_surface(
+@router.get("/{ticker}/heston", response_class=MsgspecJSONResponse)
+async def get_heston_surface(
     ticker: str,
+    market: MarketAdapterDep,
+    heston: HestonDep,
     max_maturities: int = Query(default=6, ge=2, le=10),
 ):
     """
@@ -172,11 +203,13 @@ def get_heston_surface(
     """
     try:
         ticker = ticker.upper()
-        md = _market.get_market_data(ticker)
+        md = await run_in_threadpool(market.get_market_data, ticker)
         S, r, q = float(md.spot), float(md.risk_free_rate), float(md.dividend_yield)
 
         # Use OTM options for calibration (more reliable quotes, no intrinsic ambiguity)
-        pts = _fetch_iv_points(
+        pts = await run_in_threadpool(
+            _fetch_iv_points,
+            market,
             ticker,
             S,
             r,
@@ -201,20 +234,22 @@ def get_heston_surface(
         scatter = [{k: v for k, v in p.items() if not k.startswith("_")} for p in pts]
 
         # Calibrate Heston
-        params = _heston.calibrate(cal_pts, S, r, q)
+        params = await run_in_threadpool(heston.calibrate, cal_pts, S, r, q)
 
         # Generate smooth surface
-        surface = _heston.generate_surface(S, r, q, params)
-
-        return {
-            "ticker": ticker,
-            "spot": round(S, 2),
-            "r": round(r, 4),
-            "q": round(float(q), 4),
-            "params": params,
-            "market_scatter": scatter,
-            "surface": surface,
-        }
+        surface = await run_in_threadpool(heston.generate_surface, S, r, q, params)
+
+        return MsgspecJSONResponse(
+            {
+                "ticker": ticker,
+                "spot": round(S, 2),
+                "r": round(r, 4),
+                "q": round(float(q), 4),
+                "params": params,
+                "market_scatter": scatter,
+                "surface": surface,
+            }
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
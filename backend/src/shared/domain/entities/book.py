@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass, field
 
 from ..value_objects.greeks import Greeks
@@ -21,7 +22,11 @@ class Book:
         """Agrège les Greeks de toutes les positions du book."""
         if not greeks_per_position:
             return Greeks(0.0, 0.0, 0.0, 0.0, 0.0)
-        result = greeks_per_position[0]
-        for g in greeks_per_position[1:]:
-            result = result + g
-        return result
+        # Somme par composante (fsum, sans perte de précision) : un seul Greeks alloué
+        return Greeks(
+            delta=math.fsum(g.delta for g in greeks_per_position),
+            gamma=math.fsum(g.gamma for g in greeks_per_position),
+            vega=math.fsum(g.vega for g in greeks_per_position),
+            theta=math.fsum(g.theta for g in greeks_per_position),
+            rho=math.fsum(g.rho for g in greeks_per_position),
+        )
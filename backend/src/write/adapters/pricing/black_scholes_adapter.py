@@ -1,75 +1,109 @@
+import math
 from datetime import date
+from functools import lru_cache
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
 from src.shared.domain.value_objects.greeks import Greeks
+from src.write.adapters.pricing.black_scholes_kernels import bs_greeks_scalar
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+
+def _pdf(x):
+    # Densité normale explicite — évite le dispatch rv_continuous de scipy.stats.norm
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+@lru_cache(maxsize=4096)
+def _year_fraction(maturity: date, as_of: date) -> float:
+    # `as_of` fait partie de la clé : le cache s'invalide de lui-même au changement de jour
+    days = (maturity - as_of).days
+    return max(days / 365.0, 1e-6)
+
+
+@lru_cache(maxsize=4096)
+def _unit_price_and_greeks(
+    is_call: bool, S: float, K: float, T: float, r: float, q: float, sigma: float
+) -> tuple[float, float, float, float, float, float]:
+    # Entrées arrondies par l'appelant : deux polls du dashboard à 500 ms d'écart tombent
+    # sur la même clé. T dérive d'un nombre de jours entier, pas besoin de flush à minuit.
+    return bs_greeks_scalar(S, K, T, r, q, sigma, is_call)
 
 
 class BlackScholesAdapter:
-    def _d1(self, S, K, T, r, q, sigma):
-        return (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-
-    def _d2(self, d1, sigma, T):
-        return d1 - sigma * np.sqrt(T)
-
-    def _time_to_maturity(self, maturity):
-        today = date.today()
-        days = (maturity - today).days
-        return max(days / 365.0, 1e-6)
-
-    def price(self, contract, market_data):
-        S, K = market_data.spot, contract.strike
-        T = self._time_to_maturity(contract.maturity)
-        r, q, sigma = (
-            market_data.risk_free_rate,
-            market_data.dividend_yield,
-            market_data.implied_vol,
-        )
-        d1 = self._d1(S, K, T, r, q, sigma)
-        d2 = self._d2(d1, sigma, T)
-        if contract.is_call():
-            price = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-        else:
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
-        return price * abs(contract.quantity)
-
-    def greeks(self, contract, market_data):
-        S, K = market_data.spot, contract.strike
-        T = self._time_to_maturity(contract.maturity)
-        r, q, sigma = (
-            market_data.risk_free_rate,
-            market_data.dividend_yield,
-            market_data.implied_vol,
+    def _time_to_maturity(self, maturity: date, as_of: date) -> float:
+        return _year_fraction(maturity, as_of)
+
+    def price_and_greeks(
+        self, contract, market_data, as_of: date | None = None
+    ) -> tuple[float, Greeks]:
+        """
+        Prix + Greeks en une passe : d1, d2, N(d1), N(d2), φ(d1) calculés une seule fois.
+
+        `as_of` fixe la date de valorisation (aujourd'hui par défaut) : l'appelant la fige
+        une fois par requête pour que tous les pricings partagent la même.
+        """
+        as_of = as_of or date.today()
+        price, delta, gamma, vega, theta, rho = _unit_price_and_greeks(
+            contract.is_call(),
+            round(market_data.spot, 2),
+            contract.strike,
+            self._time_to_maturity(contract.maturity, as_of),
+            round(market_data.risk_free_rate, 4),
+            round(market_data.dividend_yield, 4),
+            round(market_data.implied_vol, 4),
         )
-        d1 = self._d1(S, K, T, r, q, sigma)
-        d2 = self._d2(d1, sigma, T)
-        if contract.is_call():
-            delta = np.exp(-q * T) * norm.cdf(d1)
-        else:
-            delta = -np.exp(-q * T) * norm.cdf(-d1)
-        gamma = (np.exp(-q * T) * norm.pdf(d1)) / (S * sigma * np.sqrt(T))
-        vega = S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T) / 100
-        if contract.is_call():
-            theta = (
-                -(S * np.exp(-q * T) * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
-                - r * K * np.exp(-r * T) * norm.cdf(d2)
-                + q * S * np.exp(-q * T) * norm.cdf(d1)
-            ) / 365
-        else:
-            theta = (
-                -(S * np.exp(-q * T) * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
-                + r * K * np.exp(-r * T) * norm.cdf(-d2)
-                - q * S * np.exp(-q * T) * norm.cdf(-d1)
-            ) / 365
-        if contract.is_call():
-            rho = K * T * np.exp(-r * T) * norm.cdf(d2) / 100
-        else:
-            rho = -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
-        return Greeks(
+        greeks = Greeks(
             delta * contract.quantity,
             gamma * abs(contract.quantity),
             vega * abs(contract.quantity),
             theta * abs(contract.quantity),
             rho * contract.quantity,
         )
+        return price * abs(contract.quantity), greeks
+
+    def price(self, contract, market_data, as_of: date | None = None):
+        return self.price_and_greeks(contract, market_data, as_of)[0]
+
+    def greeks(self, contract, market_data, as_of: date | None = None):
+        return self.price_and_greeks(contract, market_data, as_of)[1]
+
+    def batch_greeks(self, S, K, T, r, q, sigma, is_call) -> dict[str, np.ndarray]:
+        """
+        Prix + Greeks vectorisés sur une chaîne d'options (quantité unitaire).
+
+        K, T, sigma, is_call sont des arrays broadcastables ; S, r, q des scalaires.
+        Renvoie un dict d'arrays (SoA) : price, delta, gamma, vega, theta, rho,
+        dans les mêmes unités que `greeks` (vega/rho par 1 %, theta par jour).
+        """
+        K = np.asarray(K, dtype=float)
+        T = np.asarray(T, dtype=float)
+        sigma = np.asarray(sigma, dtype=float)
+        sign = np.where(is_call, 1.0, -1.0)
+
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        df_q = np.exp(-q * T)
+        df_r = np.exp(-r * T)
+
+        # N(±d1), N(±d2), φ(d1) calculés une seule fois et réutilisés par tous les Greeks
+        Phi_d1 = ndtr(sign * d1)
+        Phi_d2 = ndtr(sign * d2)
+        phi_d1 = _pdf(d1)
+
+        return {
+            "price": sign * (S * df_q * Phi_d1 - K * df_r * Phi_d2),
+            "delta": sign * df_q * Phi_d1,
+            "gamma": df_q * phi_d1 / (S * sigma * sqrt_T),
+            "vega": S * df_q * phi_d1 * sqrt_T / 100,
+            "theta": (
+                -(S * df_q * phi_d1 * sigma) / (2 * sqrt_T)
+                - sign * r * K * df_r * Phi_d2
+                + sign * q * S * df_q * Phi_d1
+            )
+            / 365,
+            "rho": sign * K * T * df_r * Phi_d2 / 100,
+        }
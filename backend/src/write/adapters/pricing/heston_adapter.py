@@ -17,26 +17,24 @@ Parameters
 
 from __future__ import annotations
 
-import numpy as np
-from scipy.optimize import brentq, minimize
-from scipy.stats import norm
-
-# ── Black-Scholes helpers (for implied-vol inversion) ─────────────────────────
+import math
+from functools import lru_cache
 
+import numpy as np
+from scipy.optimize import minimize
+from scipy.special import ndtr
+from scipy.stats import qmc
 
-def _bs_call(S: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
-    if T <= 0 or sigma <= 0:
-        return max(S * np.exp(-q * T) - K * np.exp(-r * T), 0.0)
-    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    return float(S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2))
+from src.write.adapters.pricing.heston_kernels import (
+    bs_iv_array,
+    bs_iv_call,
+    bs_iv_put,
+    heston_call,
+)
 
+# ── Black-Scholes helpers (for implied-vol inversion) ─────────────────────────
 
-def _bs_vega(S: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
-    if T <= 0 or sigma <= 0:
-        return 0.0
-    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    return float(S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T))
+_INV_SQRT_2PI = 0.3989422804014327
 
 
 def bs_implied_vol(
@@ -49,126 +47,206 @@ def bs_implied_vol(
     option_type: str = "call",
 ) -> float | None:
     """
-    Compute Black-Scholes implied volatility via Newton-Raphson + Brent fallback.
+    Compute Black-Scholes implied volatility via Newton on log-price.
     Returns None if no solution found in [0.001, 5.0].
-    """
-    if T <= 0:
-        return None
-
-    # Convert put → call via put-call parity
-    if option_type == "put":
-        price = price + S * np.exp(-q * T) - K * np.exp(-r * T)
-
-    intrinsic = max(S * np.exp(-q * T) - K * np.exp(-r * T), 0.0)
-    upper = S * np.exp(-q * T)
-
-    if price <= intrinsic + 1e-9 or price >= upper:
-        return None
-
-    # Newton-Raphson
-    sigma = 0.3
-    for _ in range(25):
-        p = _bs_call(S, K, T, r, q, sigma)
-        v = _bs_vega(S, K, T, r, q, sigma)
-        if v < 1e-12:
-            break
-        step = (p - price) / v
-        sigma -= step
-        sigma = float(np.clip(sigma, 1e-4, 10.0))
-        if abs(step) < 1e-9 and 0.001 <= sigma <= 5.0:
-            return sigma
-
-    # Brent fallback
-    try:
-
-        def f(s: float) -> float:
-            return _bs_call(S, K, T, r, q, s) - price
-
-        if f(0.001) * f(5.0) > 0:
-            return None
-        sigma = float(brentq(f, 0.001, 5.0, xtol=1e-7, maxiter=100))
-        return sigma if 0.001 <= sigma <= 5.0 else None
-    except Exception:
-        return None
-
 
-# ── Heston characteristic function ────────────────────────────────────────────
+    The price is mapped to a normalised out-of-the-money call (k ≥ 0), where
+    ln c(s) has a well-behaved slope even far from the money. Newton starts
+    from a tight guess on either side of the inflection point s_c = √(2k)
+    and is kept inside a shrinking bracket, so no Brent fallback is needed.
+    The whole inversion runs as one compiled kernel, specialised per option type.
+    """
+    iv_kernel = bs_iv_call if option_type == "call" else bs_iv_put
+    sigma = iv_kernel(price, S, K, T, r, q)
+    return None if math.isnan(sigma) else sigma
 
 
-def _heston_integrand(
-    phi: np.ndarray,
+def bs_implied_vol_vec(
+    price: np.ndarray,
     S: float,
-    K: float,
-    T: float,
+    K: np.ndarray,
+    T: float | np.ndarray,
     r: float,
     q: float,
+    is_call: bool | np.ndarray = True,
+    df_r: np.ndarray | None = None,
+    df_q: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Vectorised `bs_implied_vol`: the same compiled log-price Newton, looped per element.
+
+    Returns NaN where no solution exists in [0.001, 5.0].
+    Callers that already hold e^{-rT}, e^{-qT} may pass them as `df_r`, `df_q`.
+    """
+    price, K, T = np.broadcast_arrays(
+        np.asarray(price, dtype=float), np.asarray(K, dtype=float), np.asarray(T, dtype=float)
+    )
+    df_r = np.exp(-r * T) if df_r is None else df_r
+    df_q = np.exp(-q * T) if df_q is None else df_q
+
+    def flat(x, dtype=float):
+        # astype copies: the kernel gets a contiguous, writable 1-D array
+        return np.broadcast_to(x, price.shape).astype(dtype).ravel()
+
+    iv = bs_iv_array(
+        flat(price), S, flat(K), flat(T), flat(df_r), flat(df_q), flat(is_call, np.bool_)
+    )
+    return iv.reshape(price.shape)
+
+
+# ── Heston characteristic function ────────────────────────────────────────────
+
+
+def _heston_cf_exponent(
+    iu: np.ndarray,
+    u2: np.ndarray,
+    T: float | np.ndarray,
+    mu: float,
     v0: float,
     kappa: float,
     theta: float,
     sigma_v: float,
     rho: float,
-    j: int,
 ) -> np.ndarray:
     """
-    Vectorised Heston integrand for P_j (Albrecher et al. 2007 'little trap').
+    ln of the characteristic function of ln(S_T/S) under Heston, E[e^{iu ln(S_T/S)}],
+    for log-price drift `mu` = r - q (Albrecher et al. 2007 'little trap').
 
-    P_j = 0.5 + (1/π) ∫_0^∞ Re[e^{-iφ ln K} φ_j(φ)] / (iφ) dφ
+    Takes iu and u² — frequency-only invariants the caller computes once.
+    """
+    a = kappa * theta
+    rsi = rho * sigma_v * iu
+    d = np.sqrt((rsi - kappa) ** 2 + sigma_v**2 * (iu + u2))
+
+    # Little-trap: g uses numerator = κ - ρσ iu - d
+    num_g = kappa - rsi - d
+    g = num_g / (kappa - rsi + d)
+
+    exp_neg_dT = np.exp(-d * T)
+    denom = 1.0 - g * exp_neg_dT
 
-    j=1 : u=+0.5, b=κ - ρσ_v
-    j=2 : u=-0.5, b=κ
+    D = num_g / sigma_v**2 * (1.0 - exp_neg_dT) / denom
+    C = mu * iu * T + a / sigma_v**2 * (num_g * T - 2.0 * np.log(denom / (1.0 - g)))
+    return C + D * v0
+
+
+def _heston_cf_exponent_grad(
+    iu: np.ndarray,
+    u2: np.ndarray,
+    T: np.ndarray,
+    mu: float,
+    v0: float,
+    kappa: float,
+    theta: float,
+    sigma_v: float,
+    rho: float,
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    i = 1j
-    phi = phi.astype(complex)
+    `_heston_cf_exponent` and its partials w.r.t. (v0, κ, θ, σ_v, ρ), stacked on a
+    leading axis of length 5.
 
-    u_j = 0.5 if j == 1 else -0.5
-    b_j = (kappa - rho * sigma_v) if j == 1 else kappa
-    a = kappa * theta
+    Forward-mode differentiation: each intermediate of the 'little trap' formula
+    carries its derivative alongside. A complex step cannot be used here — the
+    exponent is already complex, so Im f(x+ih)/h would be swamped by Im f(x).
+    """
 
-    d = np.sqrt((rho * sigma_v * i * phi - b_j) ** 2 - sigma_v**2 * (2 * i * u_j * phi - phi**2))
+    def seed(*partials):
+        # Derivative of a parameter-only quantity, shaped to broadcast as (5, 1, …, 1)
+        return np.array(partials, dtype=complex).reshape((5,) + (1,) * np.ndim(T))
 
-    # Little-trap: g uses numerator = b - ρσ iφ - d
-    num_g = b_j - rho * sigma_v * i * phi - d
-    den_g = b_j - rho * sigma_v * i * phi + d
+    db = seed(0.0, 1.0, 0.0, 0.0, 0.0)
+    a = kappa * theta
+    da = seed(0.0, theta, kappa, 0.0, 0.0)
+    sv2 = sigma_v**2
+    dsv2 = seed(0.0, 0.0, 0.0, 2.0 * sigma_v, 0.0)
+
+    rsi = rho * sigma_v * iu
+    drsi = seed(0.0, 0.0, 0.0, rho, sigma_v) * iu
+    quad = iu + u2
+    d = np.sqrt((rsi - kappa) ** 2 + sv2 * quad)
+    dd = (2.0 * (rsi - kappa) * (drsi - db) + dsv2 * quad) / (2.0 * d)
+
+    num_g = kappa - rsi - d
+    dnum_g = db - drsi - dd
+    den_g = kappa - rsi + d
     g = num_g / den_g
+    dg = (dnum_g * den_g - num_g * (db - drsi + dd)) / den_g**2
 
     exp_neg_dT = np.exp(-d * T)
+    dexp = -T * exp_neg_dT * dd
     denom = 1.0 - g * exp_neg_dT
+    ddenom = -(dg * exp_neg_dT + g * dexp)
+
+    D = num_g / sv2 * (1.0 - exp_neg_dT) / denom
+    dD = (dnum_g * (1.0 - exp_neg_dT) - num_g * dexp) / (sv2 * denom) - D * (
+        dsv2 / sv2 + ddenom / denom
+    )
+    L = np.log(denom / (1.0 - g))
+    dL = ddenom / denom + dg / (1.0 - g)
+    C = mu * iu * T + a / sv2 * (num_g * T - 2.0 * L)
+    dC = (da / sv2 - a * dsv2 / sv2**2) * (num_g * T - 2.0 * L) + a / sv2 * (dnum_g * T - 2.0 * dL)
+
+    return C + D * v0, dC + dD * v0 + seed(1.0, 0.0, 0.0, 0.0, 0.0) * D
+
+
+def _heston_cumulants(
+    T: np.ndarray, mu: float, v0: float, kappa: float, theta: float, sigma_v: float, rho: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """First two cumulants of ln(S_T/S) (Fang & Oosterlee 2008, Table 11)."""
+    e1 = np.exp(-kappa * T)
+    c1 = mu * T + (1.0 - e1) * (theta - v0) / (2.0 * kappa) - 0.5 * theta * T
+    c2 = (
+        sigma_v * T * kappa * e1 * (v0 - theta) * (8.0 * kappa * rho - 4.0 * sigma_v)
+        + kappa * rho * sigma_v * (1.0 - e1) * (16.0 * theta - 8.0 * v0)
+        + 2.0 * theta * kappa * T * (-4.0 * kappa * rho * sigma_v + sigma_v**2 + 4.0 * kappa**2)
+        + sigma_v**2 * ((theta - 2.0 * v0) * e1**2 + theta * (6.0 * e1 - 7.0) + 2.0 * v0)
+        + 8.0 * kappa**2 * (v0 - theta) * (1.0 - e1)
+    ) / (8.0 * kappa**3)
+    return c1, c2
 
-    D = num_g / sigma_v**2 * (1.0 - exp_neg_dT) / denom
-    C = r * i * phi * T + a / sigma_v**2 * (num_g * T - 2.0 * np.log(denom / (1.0 - g)))
 
-    f_j = np.exp(C + D * v0 + i * phi * np.log(S / K))  # = exp(…) * (S/K)^{iφ}
-    return np.real(f_j / (i * phi))  # exp(-iφ ln K) cancels with S/K formulation
+# ── HestonAdapter ─────────────────────────────────────────────────────────────
 
 
-# ── HestonAdapter ─────────────────────────────────────────────────────────────
+@lru_cache(maxsize=16)
+def _gl_nodes_weights(n: int, a: float, b: float) -> tuple[np.ndarray, np.ndarray]:
+    """Gauss-Legendre nodes and weights mapped from [-1, 1] to [a, b], shared read-only."""
+    x, w = np.polynomial.legendre.leggauss(n)
+    phi = 0.5 * (b - a) * x + 0.5 * (b + a)
+    w = np.ascontiguousarray(0.5 * (b - a) * w, dtype=np.float64)
+    phi.setflags(write=False)
+    w.setflags(write=False)
+    return phi, w
 
 
 class HestonAdapter:
     """
     Heston model pricer and calibrator.
 
-    Pricing via Gauss-Legendre quadrature on [ε, Φ_max] for numerical stability.
-    Calibration via L-BFGS-B minimising MSE in implied-vol space.
+    Batch pricing, the surface and calibration use the COS method (Fang &
+    Oosterlee 2008); the scalar `price_call` keeps compiled Gauss-Legendre
+    quadrature on [ε, Φ_max] as an independent test reference.
+    Calibration via L-BFGS-B on vega-weighted OTM price errors, with an exact gradient.
     """
 
     _PHI_LO: float = 1e-3
     _PHI_HI: float = 100.0
     _N_QUAD: int = 128
+    _N_COS: int = 64
+    _N_COS_MAX: int = 4096
+    _L_COS: float = 12.0
+    _COS_CF_TOL: float = 1e-8
+    _N_POLISH: int = 3
 
     def __init__(self) -> None:
-        x, w = np.polynomial.legendre.leggauss(self._N_QUAD)
-        # Map from [-1, 1] → [PHI_LO, PHI_HI]
-        a, b = self._PHI_LO, self._PHI_HI
-        self._phi = 0.5 * (b - a) * x + 0.5 * (b + a)
-        self._w = 0.5 * (b - a) * w
+        self._phi, w = _gl_nodes_weights(self._N_QUAD, self._PHI_LO, self._PHI_HI)
+        # 1/(πφ) of P_j = 0.5 + (1/π)∫ Im[f_j]/φ dφ folded into the weights once
+        self._w = w / (np.pi * self._phi)
+        # Warm-up: load the IV inverter /heston runs now rather than on the first request
+        bs_implied_vol_vec(np.array([10.0]), 100.0, 100.0, 1.0, 0.0, 0.0)
 
     # ── Pricing ───────────────────────────────────────────────────────────────
 
-    def _P(self, S, K, T, r, q, v0, kappa, theta, sigma_v, rho, j: int) -> float:
-        integ = _heston_integrand(self._phi, S, K, T, r, q, v0, kappa, theta, sigma_v, rho, j)
-        return 0.5 + float(np.sum(self._w * integ)) / np.pi
-
     def price_call(
         self,
         S: float,
@@ -182,17 +260,151 @@ class HestonAdapter:
         sigma_v: float,
         rho: float,
     ) -> float:
-        """Semi-analytical Heston call price."""
-        if T <= 0:
-            return max(S * np.exp(-q * T) - K * np.exp(-r * T), 0.0)
-        try:
-            P1 = self._P(S, K, T, r, q, v0, kappa, theta, sigma_v, rho, 1)
-            P2 = self._P(S, K, T, r, q, v0, kappa, theta, sigma_v, rho, 2)
-            raw = S * np.exp(-q * T) * P1 - K * np.exp(-r * T) * P2
-            floor = max(S * np.exp(-q * T) - K * np.exp(-r * T), 0.0)
-            return max(float(raw), floor)
-        except Exception:
-            return max(S * np.exp(-q * T) - K * np.exp(-r * T), 0.0)
+        """
+        Semi-analytical Heston call price by Gauss-Legendre quadrature.
+
+        Independent of the COS expansion behind the batch path, so the tests use
+        it (with `price_put` / `heston_iv`) as the reference for that path.
+        """
+        df_r, df_q = math.exp(-r * T), math.exp(-q * T)
+        return heston_call(
+            S, K, T, r - q, df_r, df_q, v0, kappa, theta, sigma_v, rho, self._phi, self._w
+        )
+
+    def price_call_batch(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: float,
+        q: float,
+        v0: float,
+        kappa: float,
+        theta: float,
+        sigma_v: float,
+        rho: float,
+    ) -> np.ndarray:
+        """
+        Heston call prices for many (K, T) points in one pass, by the COS method.
+
+        `K` and `T` broadcast against each other — pass `K[None, :]`, `T[:, None]`
+        to price a whole (maturities × strikes) grid. The characteristic function
+        is evaluated once per maturity and shared by all of its strikes.
+        """
+        K, T = np.asarray(K, dtype=float), np.asarray(T, dtype=float)
+        df_r, df_q = np.exp(-r * T), np.exp(-q * T)
+        log_SK = np.log(S / K)
+        return self._price_call_vec(
+            S, K, T, r - q, log_SK, df_r, df_q, v0, kappa, theta, sigma_v, rho
+        )
+
+    def _cos_grid(self, T, mu, v0, kappa, theta, sigma_v, rho):
+        """
+        Truncation range [a, b] of ln(S_T/S) from its cumulants, and u_n = nπ/(b - a).
+
+        N starts at `_N_COS` and doubles until |φ(u_{N-1})| is negligible at every
+        point: near-Gaussian cases stop at once, while a large σ_v with a small v0
+        (Feller badly violated) has a cf decaying only linearly in u and needs more terms.
+        """
+        params = (v0, kappa, theta, sigma_v, rho)
+        c1, c2 = _heston_cumulants(T, mu, *params)
+        half_width = self._L_COS * np.sqrt(np.abs(c2))
+        a, b = c1 - half_width, c1 + half_width
+        n_terms = self._N_COS
+        while n_terms < self._N_COS_MAX:
+            u_last = (n_terms - 1) * np.pi / (b - a)
+            log_cf = np.real(_heston_cf_exponent(1j * u_last, u_last**2, T, mu, *params))
+            if not np.any(log_cf > math.log(self._COS_CF_TOL)):  # NaN never blocks
+                break
+            n_terms *= 2
+        return a, b, np.arange(n_terms) * np.pi / (b - a)[..., None]
+
+    @staticmethod
+    def _cos_put_coefficients(S, K, log_SK, a, b, u) -> np.ndarray:
+        """
+        Cosine coefficients of the put payoff (K - S e^y)⁺ on [a, b], y = ln(S_T/S),
+        scaled by 2/(b - a) and with the first term halved: put = e^{-rT} Σ A_n · V_n.
+        The payoff is bounded, so truncation stays stable; calls follow by parity.
+        """
+        a = a[..., None]
+        top = np.clip(-log_SK[..., None], a, b[..., None])  # payoff kink ln(K/S)
+        arg = u * (top - a)
+        e_top = np.exp(top)
+        chi = (np.cos(arg) * e_top - np.exp(a) + u * np.sin(arg) * e_top) / (1.0 + u * u)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            psi = np.where(u > 0, np.sin(arg) / u, top - a)
+        V = 2.0 / (b[..., None] - a) * (K[..., None] * psi - S * chi)
+        V[..., 0] *= 0.5
+        return V
+
+    def _price_call_vec(
+        self, S, K, T, mu, log_SK, df_r, df_q, v0, kappa, theta, sigma_v, rho
+    ) -> np.ndarray:
+        # `price_call_batch` body, with drift r - q, ln(S/K) and discount factors precomputed
+        params = (v0, kappa, theta, sigma_v, rho)
+        with np.errstate(all="ignore"):
+            a, b, u = self._cos_grid(T, mu, *params)
+            expo = _heston_cf_exponent(1j * u, u * u, T[..., None], mu, *params)
+            A = np.real(np.exp(expo - 1j * u * a[..., None]))
+            V = self._cos_put_coefficients(S, K, log_SK, a, b, u)
+            # Weighting and sum over the cosine terms fused in one contraction
+            raw = df_r * np.einsum("...n,...n->...", A, V) + S * df_q - K * df_r
+        floor = np.maximum(S * df_q - K * df_r, 0.0)
+        return np.where(np.isfinite(raw), np.maximum(raw, floor), floor)
+
+    def heston_iv_batch(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: float,
+        q: float,
+        v0: float,
+        kappa: float,
+        theta: float,
+        sigma_v: float,
+        rho: float,
+    ) -> np.ndarray:
+        """Vectorised `heston_iv` (OTM option per point, same broadcasting as the pricer)."""
+        K, T = np.asarray(K, dtype=float), np.asarray(T, dtype=float)
+        # Discount factors computed once per maturity, reused by pricing, parity and inversion
+        df_r, df_q = np.exp(-r * T), np.exp(-q * T)
+        is_call = K * df_r >= S * df_q  # K ≥ forward
+        return self._heston_iv_vec(
+            S, K, T, r, q, np.log(S / K), df_r, df_q, is_call, v0, kappa, theta, sigma_v, rho
+        )
+
+    def _heston_iv_vec(
+        self, S, K, T, r, q, log_SK, df_r, df_q, is_call, v0, kappa, theta, sigma_v, rho
+    ) -> np.ndarray:
+        # `heston_iv_batch` body on precomputed per-point constants (see `calibrate`)
+        call = self._price_call_vec(
+            S, K, T, r - q, log_SK, df_r, df_q, v0, kappa, theta, sigma_v, rho
+        )
+        price = np.where(is_call, call, call + K * df_r - S * df_q)
+        return bs_implied_vol_vec(price, S, K, T, r, q, is_call, df_r=df_r, df_q=df_q)
+
+    def _price_call_grad(
+        self, S, K, T, mu, log_SK, df_r, df_q, v0, kappa, theta, sigma_v, rho
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        `_price_call_vec` and its (5, n) Jacobian w.r.t. (v0, κ, θ, σ_v, ρ),
+        zero where the intrinsic floor binds.
+
+        Only the characteristic function is differentiated: [a, b] is held fixed,
+        which moves the price by no more than the truncation error.
+        """
+        params = (v0, kappa, theta, sigma_v, rho)
+        with np.errstate(all="ignore"):
+            a, b, u = self._cos_grid(T, mu, *params)
+            expo, dexpo = _heston_cf_exponent_grad(1j * u, u * u, T[..., None], mu, *params)
+            cf = np.exp(expo - 1j * u * a[..., None])
+            V = self._cos_put_coefficients(S, K, log_SK, a, b, u)
+            raw = df_r * np.einsum("...n,...n->...", np.real(cf), V) + S * df_q - K * df_r
+            draw = df_r * np.einsum("...n,...n->...", np.real(cf * dexpo), V)
+        floor = np.maximum(S * df_q - K * df_r, 0.0)
+        live = np.isfinite(raw) & (raw > floor)
+        return np.where(live, raw, floor), np.where(live & np.isfinite(draw), draw, 0.0)
 
     def price_put(
         self,
@@ -209,7 +421,7 @@ class HestonAdapter:
     ) -> float:
         """Put price via put-call parity."""
         call = self.price_call(S, K, T, r, q, v0, kappa, theta, sigma_v, rho)
-        return call + K * np.exp(-r * T) - S * np.exp(-q * T)
+        return call + K * math.exp(-r * T) - S * math.exp(-q * T)
 
     def heston_iv(
         self,
@@ -227,13 +439,15 @@ class HestonAdapter:
         """BS implied vol from Heston model price (OTM option chosen automatically)."""
         if T <= 0:
             return None
-        F = S * np.exp((r - q) * T)
-        option_type = "call" if K >= F else "put"
-        if option_type == "call":
+        F = S * math.exp((r - q) * T)
+        # Option type fixed once here → straight into the specialised kernel
+        if K >= F:
             price = self.price_call(S, K, T, r, q, v0, kappa, theta, sigma_v, rho)
+            sigma = bs_iv_call(price, S, K, T, r, q)
         else:
             price = self.price_put(S, K, T, r, q, v0, kappa, theta, sigma_v, rho)
-        return bs_implied_vol(price, S, K, T, r, q, option_type)
+            sigma = bs_iv_put(price, S, K, T, r, q)
+        return None if math.isnan(sigma) else sigma
 
     # ── Calibration ───────────────────────────────────────────────────────────
 
@@ -243,14 +457,23 @@ class HestonAdapter:
         S: float,
         r: float,
         q: float,
+        n_restarts: int = 8,
     ) -> dict:
         """
         Calibrate Heston parameters to market implied vols.
 
+        Fitted in price space: each OTM price error is divided by the market
+        BS vega, a first-order proxy for the vol error that needs no IV
+        inversion per evaluation. The objective is multimodal: `n_restarts`
+        starting points are scored, L-BFGS-B is run from the best `_N_POLISH`
+        of them with the exact gradient from `_price_call_grad` (no finite
+        differences), and the lowest local minimum wins. `rmse` is in vol terms.
+
         Parameters
         ----------
         market_points : list of {K, T, iv, weight?}
         S, r, q      : market data
+        n_restarts   : number of starting points, ≥ 1 (the first is the ATM guess)
 
         Returns
         -------
@@ -258,35 +481,66 @@ class HestonAdapter:
         """
         if len(market_points) < 5:
             raise ValueError(f"Need ≥5 calibration points (got {len(market_points)})")
+        if n_restarts < 1:
+            raise ValueError(f"Need ≥1 starting point (got n_restarts={n_restarts})")
 
-        atm_iv = float(np.median([p["iv"] for p in market_points]))
+        # Dicts read once, in one pass: one contiguous row per field from here on
+        K, T, iv_mkt, w = self._market_arrays(market_points)
+
+        atm_iv = float(np.median(iv_mkt))
         x0 = np.array([atm_iv**2, 2.0, atm_iv**2, 0.4, -0.7])
         bounds = [(1e-4, 0.9), (0.1, 15.0), (1e-4, 0.9), (0.05, 2.0), (-0.99, 0.99)]
-
-        def objective(x: np.ndarray) -> float:
-            v0_, kappa_, theta_, sigma_v_, rho_ = x
-            total, n = 0.0, 0
-            for pt in market_points:
-                K, T, iv_mkt = pt["K"], pt["T"], pt["iv"]
-                w = pt.get("weight", 1.0)
-                try:
-                    iv_mdl = self.heston_iv(S, K, T, r, q, v0_, kappa_, theta_, sigma_v_, rho_)
-                    if iv_mdl is not None and 0.001 < iv_mdl < 5.0:
-                        total += w * (iv_mdl - iv_mkt) ** 2
-                        n += 1
-                    else:
-                        total += w * 0.25
-                except Exception:
-                    total += 0.25
-            return total / max(n, 1)
-
-        result = minimize(
-            objective,
-            x0,
-            method="L-BFGS-B",
-            bounds=bounds,
-            options={"maxiter": 300, "ftol": 1e-10, "gtol": 1e-7},
+        X0 = self._restart_points(x0, bounds, n_restarts)
+
+        # Per-point constants, invariant across every objective evaluation
+        df_r, df_q = np.exp(-r * T), np.exp(-q * T)
+        log_SK = np.log(S / K)
+        otm_is_call = K * df_r >= S * df_q  # K ≥ forward
+        parity = np.where(otm_is_call, 0.0, K * df_r - S * df_q)  # put = call + parity
+        market = (S, K, T, r - q, log_SK, df_r, df_q)
+
+        # Market OTM prices and vegas at the quoted vols, computed once
+        sqrt_T = np.sqrt(T)
+        d1 = (log_SK + (r - q + 0.5 * iv_mkt**2) * T) / (iv_mkt * sqrt_T)
+        call_mkt = S * df_q * ndtr(d1) - K * df_r * ndtr(d1 - iv_mkt * sqrt_T)
+        price_mkt = call_mkt + parity
+        vega_mkt = np.maximum(S * df_q * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sqrt_T, 1e-8)
+        scale = w / (vega_mkt * len(w))
+
+        def loss(x: np.ndarray) -> float:
+            # Every market point priced in one call, no gradient
+            call = self._price_call_vec(*market, *x)
+            return float(np.sum(scale * (call + parity - price_mkt) ** 2 / vega_mkt))
+
+        def objective(x: np.ndarray) -> tuple[float, np.ndarray]:
+            # Loss and exact gradient in one pass; OTM puts share the call Jacobian
+            call, d_call = self._price_call_grad(*market, *x)
+            resid = call + parity - price_mkt
+            total = np.sum(scale * resid**2 / vega_mkt)
+            return float(total), d_call @ (2.0 * scale * resid / vega_mkt)
+
+        # Cheap price-only scoring of every start, full gradient descent from the best few
+        starts = X0[np.argsort([loss(x) for x in X0])[: self._N_POLISH]]
+        result = min(
+            (
+                minimize(
+                    objective,
+                    start,
+                    jac=True,
+                    method="L-BFGS-B",
+                    bounds=bounds,
+                    options={"maxiter": 300, "ftol": 1e-12, "gtol": 1e-8},
+                )
+                for start in starts
+            ),
+            key=lambda res: res.fun,
         )
+
+        # Reported fit in vol terms, one inversion at the optimum
+        iv_mdl = self._heston_iv_vec(S, K, T, r, q, log_SK, df_r, df_q, otm_is_call, *result.x)
+        valid = (iv_mdl > 0.001) & (iv_mdl < 5.0)
+        sq_err = np.sum(np.where(valid, w * (iv_mdl - iv_mkt) ** 2, w * 0.25))
+        rmse = np.sqrt(sq_err / max(int(valid.sum()), 1))
         v0, kappa, theta, sigma_v, rho = result.x
         return {
             "v0": float(v0),
@@ -294,11 +548,27 @@ class HestonAdapter:
             "theta": float(theta),
             "sigma_v": float(sigma_v),
             "rho": float(rho),
-            "rmse": float(np.sqrt(result.fun)),
+            "rmse": float(rmse),
             "success": bool(result.success),
             "n_points": len(market_points),
         }
 
+    @staticmethod
+    def _market_arrays(market_points: list[dict]) -> np.ndarray:
+        """(4, n) contiguous float array of K, T, iv, weight rows."""
+        rows = [(p["K"], p["T"], p["iv"], p.get("weight", 1.0)) for p in market_points]
+        return np.ascontiguousarray(np.array(rows, dtype=float).T)
+
+    @staticmethod
+    def _restart_points(x0: np.ndarray, bounds: list, n: int) -> np.ndarray:
+        """x0 followed by n-1 deterministic quasi-random starts around it."""
+        v = x0[0]
+        lo = np.array([0.25 * v, 0.5, 0.25 * v, 0.1, -0.95])
+        hi = np.array([4.0 * v, 6.0, 4.0 * v, 1.5, 0.3])
+        u = qmc.Halton(d=5, seed=0).random(n - 1)
+        starts = np.vstack([x0, lo + u * (hi - lo)])
+        return np.clip(starts, [b[0] for b in bounds], [b[1] for b in bounds])
+
     # ── Surface generation ────────────────────────────────────────────────────
 
     def generate_surface(
@@ -325,20 +595,22 @@ class HestonAdapter:
         rho = params["rho"]
 
         moneyness = np.linspace(0.70, 1.30, n_strikes)
-        strikes = (moneyness * S).tolist()
-        maturities = np.linspace(1 / 12, 2.0, n_maturities).tolist()  # 1m → 2y
+        strikes = moneyness * S
+        maturities = np.linspace(1 / 12, 2.0, n_maturities)  # 1m → 2y
 
-        ivs: list[list[float | None]] = []
-        for T in maturities:
-            row: list[float | None] = []
-            for K in strikes:
-                iv = self.heston_iv(S, K, T, r, q, v0, kappa, theta, sigma_v, rho)
-                row.append(round(iv * 100, 4) if iv is not None else None)
-            ivs.append(row)
+        # COS prices the grid with one characteristic function per maturity,
+        # then a single compiled pass inverts every point
+        grid = self.heston_iv_batch(
+            S, strikes[None, :], maturities[:, None], r, q, v0, kappa, theta, sigma_v, rho
+        )
+        ivs: list[list[float | None]] = [
+            [round(iv * 100, 4) if math.isfinite(iv) else None for iv in row]
+            for row in grid.tolist()
+        ]
 
         return {
-            "strikes": [round(k, 2) for k in strikes],
-            "moneyness": [round(float(m), 4) for m in moneyness],
-            "maturities_years": [round(T, 4) for T in maturities],
+            "strikes": [round(k, 2) for k in strikes.tolist()],
+            "moneyness": [round(m, 4) for m in moneyness.tolist()],
+            "maturities_years": [round(T, 4) for T in maturities.tolist()],
             "implied_vols": ivs,  # shape [n_maturities][n_strikes], values in %
         }
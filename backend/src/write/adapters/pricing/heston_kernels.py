@@ -0,0 +1,269 @@
+"""
+Heston Numba kernels
+====================
+
+Compiled building blocks for implied-vol inversion and the scalar reference
+pricer: the characteristic-function integrand (same 'little trap' formulation
+as `heston_adapter`), a Gauss-Legendre call pricer and BS implied-vol inverters
+specialised per option type.
+
+Every kernel called from Python releases the GIL, so IV requests
+served by concurrent threadpool workers run in parallel with each other. None
+is `parallel=True`: numba's default workqueue threading layer aborts the
+process when two threads launch a parallel region at once.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit
+
+_SQRT1_2 = 0.7071067811865476
+_INV_SQRT_2PI = 0.3989422804014327
+
+
+@njit(fastmath=True, cache=True, inline="always")
+def _cdiv(ar: float, ai: float, br: float, bi: float) -> tuple[float, float]:
+    inv = 1.0 / (br * br + bi * bi)
+    return (ar * br + ai * bi) * inv, (ai * br - ar * bi) * inv
+
+
+@njit(fastmath=True, cache=True)
+def heston_integrand(
+    phi: float,
+    log_SK: float,
+    T: float,
+    mu: float,
+    v0: float,
+    kappa: float,
+    theta: float,
+    sigma_v: float,
+    rho: float,
+    j: int,
+) -> float:
+    """
+    Im[exp(C + D·v0 + iφ ln(S/K))] for P_j at a single node φ, log-price drift
+    `mu` = r - q. This equals φ·Re[… / (iφ)]; the 1/φ lives in the quadrature weights.
+
+    Written in split (re, im) float64 arithmetic: every complex operand here has
+    known structure (iφ is pure imaginary, b and σ_v² are real), so the expanded
+    form skips the zero products complex128 would compute, and LLVM vectorises it.
+    """
+    if j == 1:
+        u_j = 0.5
+        b_j = kappa - rho * sigma_v
+    else:
+        u_j = -0.5
+        b_j = kappa
+    a = kappa * theta
+    sv2 = sigma_v * sigma_v
+    rs_phi = rho * sigma_v * phi  # ρσ_v iφ = (0, rs_phi)
+
+    # d = √[(ρσ_v iφ - b)² - σ_v²(2u iφ - φ²)], principal branch
+    xr = b_j * b_j - rs_phi * rs_phi + sv2 * phi * phi
+    xi = -2.0 * b_j * rs_phi - 2.0 * u_j * sv2 * phi
+    m = math.hypot(xr, xi)
+    dr = math.sqrt(0.5 * (m + xr))
+    di = math.copysign(math.sqrt(0.5 * (m - xr)), xi)
+
+    # Little trap: g = (b - ρσ iφ - d) / (b - ρσ iφ + d)
+    nr = b_j - dr
+    ni = -rs_phi - di
+    gr, gi = _cdiv(nr, ni, b_j + dr, -rs_phi + di)
+
+    # e^{-dT}, 1 - g·e^{-dT}, 1 - g
+    mag = math.exp(-dr * T)
+    er = mag * math.cos(di * T)
+    ei = -mag * math.sin(di * T)
+    den_r = 1.0 - (gr * er - gi * ei)
+    den_i = -(gr * ei + gi * er)
+
+    # D = num_g (1 - e^{-dT}) / (σ_v² · denom)
+    tr = nr * (1.0 - er) + ni * ei
+    ti = ni * (1.0 - er) - nr * ei
+    Dr, Di = _cdiv(tr, ti, sv2 * den_r, sv2 * den_i)
+
+    # ln[denom / (1 - g)], principal branch
+    qr, qi = _cdiv(den_r, den_i, 1.0 - gr, -gi)
+    lr = 0.5 * math.log(qr * qr + qi * qi)
+    li = math.atan2(qi, qr)
+
+    # C = μ iφ T + (a/σ_v²)(num_g T - 2 ln(…))
+    k = a / sv2
+    Cr = k * (nr * T - 2.0 * lr)
+    Ci = mu * phi * T + k * (ni * T - 2.0 * li)
+
+    # Im exp(C + D·v0 + iφ ln(S/K))
+    return math.exp(Cr + Dr * v0) * math.sin(Ci + Di * v0 + phi * log_SK)
+
+
+@njit(cache=True, nogil=True)
+def heston_call(
+    S: float,
+    K: float,
+    T: float,
+    mu: float,
+    df_r: float,
+    df_q: float,
+    v0: float,
+    kappa: float,
+    theta: float,
+    sigma_v: float,
+    rho: float,
+    phi: np.ndarray,
+    w: np.ndarray,
+) -> float:
+    """
+    Heston call via Gauss-Legendre quadrature, floored at intrinsic value.
+    `w` are the quadrature weights with the 1/(πφ) of P_j already folded in.
+    The drift r - q and discount factors e^{-rT}, e^{-qT} are passed in, computed once
+    per maturity.
+    """
+    floor = max(S * df_q - K * df_r, 0.0)
+    if T <= 0.0:
+        return floor
+
+    log_SK = math.log(S / K)
+    s1 = 0.0
+    s2 = 0.0
+    for k in range(phi.shape[0]):
+        s1 += w[k] * heston_integrand(phi[k], log_SK, T, mu, v0, kappa, theta, sigma_v, rho, 1)
+        s2 += w[k] * heston_integrand(phi[k], log_SK, T, mu, v0, kappa, theta, sigma_v, rho, 2)
+    P1 = 0.5 + s1
+    P2 = 0.5 + s2
+
+    raw = S * df_q * P1 - K * df_r * P2
+    if not math.isfinite(raw):
+        return floor
+    return max(raw, floor)
+
+
+@njit(fastmath=True, cache=True, inline="always")
+def ndtr(x: float) -> float:
+    # erfc form: keeps relative accuracy in the lower tail, where erf cancels
+    return 0.5 * math.erfc(-x * _SQRT1_2)
+
+
+@njit(cache=True)
+def normalised_otm_call(k: float, s: float) -> tuple[float, float]:
+    """Undiscounted call / forward at k = ln(K/F) ≥ 0, total vol s = σ√T, and ∂/∂s."""
+    d1 = -k / s + 0.5 * s
+    return ndtr(d1) - math.exp(k) * ndtr(d1 - s), _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+
+
+@njit(cache=True)
+def implied_total_vol(k: float, c: float, sqrt_T: float) -> float:
+    """
+    σ from the normalised OTM call price c at k = ln(K/F) ≥ 0, by Newton on ln c(s)
+    in total-vol space s = σ√T; NaN when there is no solution in [0.001, 5.0].
+    """
+    lo = 0.001 * sqrt_T
+    hi = 5.0 * sqrt_T
+    if not (normalised_otm_call(k, lo)[0] < c < normalised_otm_call(k, hi)[0]):
+        return np.nan
+
+    # Initial guess either side of the inflection point s_c = √(2k): small-vol
+    # asymptotic ln c ≈ -k²/2s² below it, Brenner-Subrahmanyam c ≈ s/√(2π) above
+    s_c = math.sqrt(2.0 * k)
+    c_c = normalised_otm_call(k, s_c)[0] if k > 0.0 else 0.0
+    if c < c_c:
+        s = k / math.sqrt(2.0 * math.log(c_c / c) + 0.5 * k)
+    else:
+        s = max(c / _INV_SQRT_2PI, s_c)
+    if not (lo < s < hi):
+        s = 0.5 * (lo + hi)
+
+    log_c = math.log(c)
+    for _ in range(50):
+        c_s, vega = normalised_otm_call(k, s)
+        if c_s > c:
+            hi = s
+        else:
+            lo = s
+        # Newton on ln c(s): step = (ln c(s) - ln c) · c(s) / c'(s)
+        if c_s > 0.0 and vega > 0.0:
+            new_s = s - (math.log(c_s) - log_c) * c_s / vega
+        else:
+            new_s = lo
+        if not (lo < new_s < hi):
+            new_s = 0.5 * (lo + hi)
+        if abs(new_s - s) < 1e-9 * sqrt_T:
+            s = new_s
+            break
+        s = new_s
+
+    sigma = s / sqrt_T
+    return sigma if 0.001 <= sigma <= 5.0 else np.nan
+
+
+@njit(cache=True)
+def iv_call(price: float, fwd_df: float, strike_df: float, T: float) -> float:
+    """
+    Implied vol of a call from S·e^{-qT} and K·e^{-rT};
+    NaN outside (intrinsic, S·e^{-qT}) or [0.001, 5.0].
+    """
+    if T <= 0.0:
+        return np.nan
+    if price <= max(fwd_df - strike_df, 0.0) + 1e-9 or price >= fwd_df:
+        return np.nan
+    k = math.log(strike_df / fwd_df)
+    c = price / fwd_df
+    if k < 0.0:
+        # ITM call → its OTM put by parity, reflected by put(k) = e^k·call(-k)
+        return implied_total_vol(-k, (c - (1.0 - math.exp(k))) * math.exp(-k), math.sqrt(T))
+    return implied_total_vol(k, c, math.sqrt(T))
+
+
+@njit(cache=True)
+def iv_put(price: float, fwd_df: float, strike_df: float, T: float) -> float:
+    """
+    Implied vol of a put from S·e^{-qT} and K·e^{-rT};
+    NaN outside (intrinsic, K·e^{-rT}) or [0.001, 5.0].
+    """
+    if T <= 0.0:
+        return np.nan
+    if price <= max(strike_df - fwd_df, 0.0) + 1e-9 or price >= strike_df:
+        return np.nan
+    k = math.log(strike_df / fwd_df)
+    p = price / fwd_df
+    if k < 0.0:
+        # OTM put, reflected directly: no parity round trip, no cancellation
+        return implied_total_vol(-k, p * math.exp(-k), math.sqrt(T))
+    # ITM put → OTM call by parity
+    return implied_total_vol(k, p + 1.0 - math.exp(k), math.sqrt(T))
+
+
+@njit(cache=True, nogil=True)
+def bs_iv_call(price: float, S: float, K: float, T: float, r: float, q: float) -> float:
+    """Implied vol of a call; NaN outside (intrinsic, S·e^{-qT}) or [0.001, 5.0]."""
+    return iv_call(price, S * math.exp(-q * T), K * math.exp(-r * T), T)
+
+
+@njit(cache=True, nogil=True)
+def bs_iv_put(price: float, S: float, K: float, T: float, r: float, q: float) -> float:
+    """Implied vol of a put; NaN outside (intrinsic, K·e^{-rT}) or [0.001, 5.0]."""
+    return iv_put(price, S * math.exp(-q * T), K * math.exp(-r * T), T)
+
+
+@njit(cache=True, nogil=True)
+def bs_iv_array(
+    price: np.ndarray,
+    S: float,
+    K: np.ndarray,
+    T: np.ndarray,
+    df_r: np.ndarray,
+    df_q: np.ndarray,
+    is_call: np.ndarray,
+) -> np.ndarray:
+    """`bs_iv_call` / `bs_iv_put` over flat arrays, option type chosen per element."""
+    out = np.empty(price.shape[0])
+    for i in range(price.shape[0]):
+        fwd_df = S * df_q[i]
+        strike_df = K[i] * df_r[i]
+        if is_call[i]:
+            out[i] = iv_call(price[i], fwd_df, strike_df, T[i])
+        else:
+            out[i] = iv_put(price[i], fwd_df, strike_df, T[i])
+    return out
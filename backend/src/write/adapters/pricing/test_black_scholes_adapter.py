@@ -90,3 +90,26 @@ def test_theta_negative(pricer, call_contract, market_data):
     """Le theta est toujours négatif — le temps joue contre l'acheteur."""
     greeks = pricer.greeks(call_contract, market_data)
     assert greeks.theta < 0
+
+
+def test_batch_greeks_matches_scalar(pricer, call_contract, put_contract, market_data):
+    T = pricer._time_to_maturity(call_contract.maturity, date.today())
+    batch = pricer.batch_greeks(
+        market_data.spot,
+        [call_contract.strike, put_contract.strike],
+        [T, T],
+        market_data.risk_free_rate,
+        market_data.dividend_yield,
+        [market_data.implied_vol] * 2,
+        [True, False],
+    )
+    for i, contract in enumerate([call_contract, put_contract]):
+        greeks = pricer.greeks(contract, market_data)
+        assert batch["price"][i] == pytest.approx(
+            pricer.price(contract, market_data), rel=1e-5, abs=1e-6
+        )
+        assert batch["delta"][i] == pytest.approx(greeks.delta, rel=1e-5, abs=1e-6)
+        assert batch["gamma"][i] == pytest.approx(greeks.gamma, rel=1e-5, abs=1e-6)
+        assert batch["vega"][i] == pytest.approx(greeks.vega, rel=1e-5, abs=1e-6)
+        assert batch["theta"][i] == pytest.approx(greeks.theta, rel=1e-5, abs=1e-6)
+        assert batch["rho"][i] == pytest.approx(greeks.rho, rel=1e-5, abs=1e-6)
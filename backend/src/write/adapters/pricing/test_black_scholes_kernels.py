@@ -0,0 +1,31 @@
+import pytest
+from scipy.special import ndtr
+
+from src.write.adapters.pricing.black_scholes_kernels import (
+    bs_greeks_scalar,
+    norm_cdf,
+)
+
+
+@pytest.mark.parametrize("x", [-6.0, -2.5, -1.0, -1e-3, 0.0, 0.3, 1.0, 2.5, 6.0])
+def test_norm_cdf_matches_ndtr(x):
+    assert norm_cdf(x) == pytest.approx(ndtr(x), abs=1e-7)
+
+
+def test_atm_call_analytic_values():
+    """S=K=100, T=1, r=5 %, σ=20 % : valeurs de référence Hull."""
+    price, delta, gamma, vega, theta, rho = bs_greeks_scalar(
+        100.0, 100.0, 1.0, 0.05, 0.0, 0.20, True
+    )
+    assert price == pytest.approx(10.4506, abs=1e-4)
+    assert delta == pytest.approx(0.6368, abs=1e-4)
+    assert gamma == pytest.approx(0.018762, abs=1e-6)
+    assert vega == pytest.approx(0.375240, abs=1e-6)
+    assert theta == pytest.approx(-6.4140 / 365, abs=1e-5)
+    assert rho == pytest.approx(0.532325, abs=1e-6)
+
+
+def test_atm_put_analytic_values():
+    price, delta, *_ = bs_greeks_scalar(100.0, 100.0, 1.0, 0.05, 0.0, 0.20, False)
+    assert price == pytest.approx(5.5735, abs=1e-4)
+    assert delta == pytest.approx(-0.3632, abs=1e-4)
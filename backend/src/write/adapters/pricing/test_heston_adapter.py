@@ -0,0 +1,181 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+from scipy.special import ndtr
+
+from src.write.adapters.pricing import heston_adapter
+from src.write.adapters.pricing.heston_adapter import (
+    HestonAdapter,
+    bs_implied_vol,
+    bs_implied_vol_vec,
+)
+
+S, R, Q = 100.0, 0.05, 0.01
+PARAMS = {"v0": 0.04, "kappa": 1.5, "theta": 0.05, "sigma_v": 0.5, "rho": -0.6}
+
+
+def bs_call(S, K, T, r, q, sigma):
+    sig_sqrt_T = sigma * math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma**2) * T) / sig_sqrt_T
+    return S * math.exp(-q * T) * ndtr(d1) - K * math.exp(-r * T) * ndtr(d1 - sig_sqrt_T)
+
+
+@pytest.fixture(scope="module")
+def heston():
+    return HestonAdapter()
+
+
+def test_bs_implied_vol_round_trip():
+    price = bs_call(S, 110.0, 0.5, R, Q, 0.25)
+    assert bs_implied_vol(price, S, 110.0, 0.5, R, Q, "call") == pytest.approx(0.25, abs=1e-6)
+
+
+@pytest.mark.parametrize("K", [40.0, 70.0, 95.0, 100.0, 105.0, 140.0, 250.0])
+@pytest.mark.parametrize("T", [0.02, 0.5, 2.0])
+@pytest.mark.parametrize("sigma", [0.05, 0.3, 1.5])
+def test_bs_implied_vol_round_trip_far_from_the_money(K, T, sigma):
+    call = bs_call(S, K, T, R, Q, sigma)
+    put = call + K * np.exp(-R * T) - S * np.exp(-Q * T)
+    for price, option_type in [(call, "call"), (put, "put")]:
+        iv = bs_implied_vol(price, S, K, T, R, Q, option_type)
+        # Prices too close to intrinsic carry no recoverable vol information
+        if iv is not None:
+            assert iv == pytest.approx(sigma, abs=1e-6)
+
+
+def test_bs_implied_vol_vec_matches_scalar():
+    K = np.array([70.0, 90.0, 100.0, 115.0, 130.0])
+    T = np.array([0.1, 0.5, 1.0, 1.5, 2.0])
+    sigma = np.array([0.45, 0.3, 0.2, 0.25, 0.6])
+    calls = np.array([bs_call(S, k, t, R, Q, s) for k, t, s in zip(K, T, sigma, strict=True)])
+    puts = calls + K * np.exp(-R * T) - S * np.exp(-Q * T)
+
+    np.testing.assert_allclose(bs_implied_vol_vec(calls, S, K, T, R, Q, True), sigma, atol=1e-7)
+    np.testing.assert_allclose(bs_implied_vol_vec(puts, S, K, T, R, Q, False), sigma, atol=1e-7)
+    for k, t, p in zip(K, T, puts, strict=True):
+        scalar = bs_implied_vol(p, S, k, t, R, Q, "put")
+        assert bs_implied_vol_vec(np.array([p]), S, k, t, R, Q, False)[0] == pytest.approx(
+            scalar, abs=1e-7
+        )
+
+
+def test_bs_implied_vol_vec_returns_nan_outside_bounds():
+    intrinsic = S * np.exp(-Q) - 80.0 * np.exp(-R)
+    iv = bs_implied_vol_vec(np.array([intrinsic - 1.0, S]), S, 80.0, 1.0, R, Q, True)
+    assert np.isnan(iv).all()
+
+
+def test_heston_iv_batch_matches_quadrature_reference(heston):
+    # COS batch against the independent Gauss-Legendre scalar path
+    K = np.array([85.0, 100.0, 115.0, 90.0, 110.0])
+    T = np.array([0.25, 0.25, 0.5, 1.0, 1.5])
+    batch = heston.heston_iv_batch(S, K, T, R, Q, *PARAMS.values())
+    for i in range(len(K)):
+        assert batch[i] == pytest.approx(heston.heston_iv(S, K[i], T[i], R, Q, **PARAMS), abs=5e-4)
+
+
+def test_generate_surface_short_maturity_row_is_complete(heston):
+    surface = heston.generate_surface(S, R, Q, PARAMS, n_strikes=7, n_maturities=3)
+    assert all(iv is not None for iv in surface["implied_vols"][0])
+
+
+def test_heston_iv_batch_broadcasts_over_grid(heston):
+    K = np.linspace(0.70, 1.30, 5) * S
+    T = np.linspace(1 / 12, 2.0, 3)
+    grid = heston.heston_iv_batch(S, K[None, :], T[:, None], R, Q, *PARAMS.values())
+    surface = heston.generate_surface(S, R, Q, PARAMS, n_strikes=5, n_maturities=3)
+    assert grid.shape == (3, 5)
+    np.testing.assert_allclose(
+        grid * 100, np.array(surface["implied_vols"], dtype=float), atol=1e-3
+    )
+
+
+def test_calibrate_fits_synthetic_heston_surface(heston):
+    points = [
+        {"K": K, "T": T, "iv": heston.heston_iv(S, K, T, R, Q, **PARAMS)}
+        for T in (0.1, 0.3, 0.6, 1.0)
+        for K in (80.0, 90.0, 100.0, 110.0, 120.0)
+    ]
+    points = [p for p in points if p["iv"] is not None]
+    result = heston.calibrate(points, S, R, Q, n_restarts=4)
+    assert result["success"]
+    assert result["rmse"] < 0.005
+    assert result["v0"] == pytest.approx(PARAMS["v0"], abs=0.005)
+    assert result["rho"] == pytest.approx(PARAMS["rho"], abs=0.05)
+
+
+def test_calibrate_keeps_the_best_local_minimum(heston, monkeypatch):
+    runs = []
+
+    def spy(*args, **kwargs):
+        runs.append(minimize(*args, **kwargs))
+        return runs[-1]
+
+    monkeypatch.setattr(heston_adapter, "minimize", spy)
+    points = [
+        {"K": K, "T": T, "iv": 0.2 + 0.1 * (1.0 - K / S) ** 2}
+        for T in (0.25, 1.0)
+        for K in (80.0, 90.0, 100.0, 110.0, 120.0)
+    ]
+    result = heston.calibrate(points, S, R, Q, n_restarts=6)
+
+    assert len(runs) == HestonAdapter._N_POLISH
+    best = min(runs, key=lambda res: res.fun)
+    assert [result[k] for k in PARAMS] == pytest.approx(list(best.x))
+
+
+def test_calibrate_requires_a_starting_point(heston):
+    points = [{"K": K, "T": 0.5, "iv": 0.2} for K in (80.0, 90.0, 100.0, 110.0, 120.0)]
+    with pytest.raises(ValueError):
+        heston.calibrate(points, S, R, Q, n_restarts=0)
+
+
+def test_price_call_grad_matches_finite_differences(heston):
+    K = np.array([80.0, 95.0, 100.0, 105.0, 125.0])
+    T = np.array([0.1, 0.3, 0.5, 1.0, 2.0])
+    market = (S, K, T, R, np.log(S / K), np.exp(-R * T), np.exp(-Q * T))
+    x = np.array(list(PARAMS.values()))
+
+    call, d_call = heston._price_call_grad(*market, *x)
+    np.testing.assert_allclose(call, heston._price_call_vec(*market, *x))
+    for k in range(5):
+        h = np.zeros(5)
+        h[k] = 1e-5
+        fd = (
+            heston._price_call_vec(*market, *(x + h)) - heston._price_call_vec(*market, *(x - h))
+        ) / 2e-5
+        np.testing.assert_allclose(d_call[k], fd, rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("T", [0.25, 1.0, 2.0])
+def test_pricers_reduce_to_black_scholes_with_dividends(heston, T):
+    # σ_v → 0, ρ = 0, v0 = θ: constant variance, so every path must price at the
+    # BS value — with q ≠ 0 the forward drift is r - q, not r
+    K = np.array([80.0, 100.0, 120.0])
+    q = 0.03
+    x = (0.04, 1.5, 0.04, 0.01, 0.0)
+    expected = [bs_call(S, k, T, R, q, 0.2) for k in K]
+
+    scalar = [heston.price_call(S, k, T, R, q, *x) for k in K]
+    np.testing.assert_allclose(scalar, expected, atol=5e-3)
+    np.testing.assert_allclose(heston.price_call_batch(S, K, T, R, q, *x), expected, atol=5e-3)
+
+
+def test_generate_surface_flat_with_dividends(heston):
+    x = {"v0": 0.04, "kappa": 1.5, "theta": 0.04, "sigma_v": 0.01, "rho": 0.0}
+    surface = heston.generate_surface(S, R, 0.03, x, n_strikes=7, n_maturities=3)
+    # 1-month 70 % put: BS price ≈ 2e-10, below the inverter's 1e-9 resolution
+    assert surface["implied_vols"][0][0] is None
+    np.testing.assert_allclose(surface["implied_vols"][0][1:], 20.0, atol=0.01)
+    np.testing.assert_allclose(surface["implied_vols"][1:], 20.0, atol=0.01)
+
+
+def test_generate_surface_from_concurrent_threads(heston):
+    # Concurrent /heston requests: every worker prices and inverts its grid at once
+    expected = heston.generate_surface(S, R, Q, PARAMS)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        surfaces = list(pool.map(lambda _: heston.generate_surface(S, R, Q, PARAMS), range(8)))
+    assert all(surface == expected for surface in surfaces)